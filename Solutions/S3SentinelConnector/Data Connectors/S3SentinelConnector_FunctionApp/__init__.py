@@ -4,26 +4,197 @@ S3 to Sentinel Data Connector - Azure Function
 Ingests logs from AWS S3 into Microsoft Sentinel via Data Collection Rules (DCR)
 """
 
+import csv
 import gzip
+import io
 import json
 import logging
 import os
+import queue
+import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, cast
+from itertools import chain, islice, repeat
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import azure.functions as func
 import boto3
-from azure.core.exceptions import AzureError
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+from azure.core.credentials import TokenCredential
+from azure.core.exceptions import AzureError, ResourceNotFoundError
+from azure.identity import (
+    ChainedTokenCredential,
+    DefaultAzureCredential,
+    ManagedIdentityCredential,
+)
 from azure.keyvault.secrets import SecretClient
 from azure.monitor.ingestion import LogsIngestionClient
+from azure.storage.blob import ContainerClient
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
+# Prefer a C JSON decoder for the per-record hot path; fall back to stdlib.
+# All three raise ValueError subclasses on malformed input.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        _json_loads = ujson.loads
+    except ImportError:
+        _json_loads = json.loads
+
+# Gzip bodies are inflated with ISA-L when available; IGzipFile subclasses
+# gzip.GzipFile, so both readers support peek() and line iteration
+try:
+    from isal.igzip import IGzipFile as _GzipFile
+except ImportError:
+    _GzipFile = gzip.GzipFile
+
+# Very large gzip objects are inflated block-parallel when rapidgzip is
+# installed; smaller ones stay on the cheaper single-threaded reader
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+# Exact shapes of the ISO-style configured formats. Each shape accepts a
+# subset of what strptime accepts for its format, so a match parses to the
+# same datetime strptime would return
+_ISO_FORMAT_SHAPES = {
+    "%Y-%m-%dT%H:%M:%S.%fZ": re.compile(
+        r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})\.(\d{1,6})Z"
+    ),
+    "%Y-%m-%dT%H:%M:%SZ": re.compile(
+        r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})()Z"
+    ),
+    "%Y-%m-%d %H:%M:%S": re.compile(
+        r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})()"
+    ),
+}
+
+# "%b %d %Y %H:%M:%S" (e.g. "Feb 20 2024 13:45:00") matched without strptime
+_MONTH_DAY_YEAR_FORMAT = "%b %d %Y %H:%M:%S"
+_MONTH_DAY_YEAR_RE = re.compile(
+    r"([A-Za-z]{3}) (\d{1,2}) (\d{4}) (\d{1,2}):(\d{1,2}):(\d{1,2})"
+)
+_MONTH_NUMBERS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "jan",
+            "feb",
+            "mar",
+            "apr",
+            "may",
+            "jun",
+            "jul",
+            "aug",
+            "sep",
+            "oct",
+            "nov",
+            "dec",
+        ),
+        start=1,
+    )
+}
+
+# Credential and Key Vault-sourced AWS keys survive across warm invocations
+# and connector re-initialisation, avoiding repeated IMDS/Key Vault round-trips
+_CACHED_CREDENTIAL: Optional[TokenCredential] = None
+_CACHED_AWS_SECRETS: Dict[str, Tuple[str, str]] = {}
+
+# Processable S3 keys: a known log extension and no temp/partial marker,
+# matched case-insensitively in a single pass
+_VALID_FILE_RE = re.compile(
+    r"(?!.*(?:temp|partial|incomplete|_tmp)).*\.(?:log|json|gz|csv|txt)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _json_loads_bytes(raw: bytes) -> Any:
+    """Decode JSON straight from bytes, skipping a full UTF-8 decode
+
+    Input that is not valid UTF-8 is retried with replacement characters,
+    matching the lenient decoding applied to text logs.
+    """
+    try:
+        return _json_loads(raw)
+    except ValueError:
+        return _json_loads(raw.decode("utf-8", errors="replace"))
+
+
+def _split_delimited(line: str, delimiter: str) -> List[str]:
+    """Split one delimited line, honouring quoted fields
+
+    A line with malformed quoting (e.g. an unterminated quote) is split on
+    the bare delimiter instead.
+    """
+    if '"' not in line:
+        return line.split(delimiter)
+    try:
+        return next(csv.reader((line,), delimiter=delimiter, strict=True))
+    except csv.Error:
+        return line.split(delimiter)
+
+
+# Fallback scanner for concatenated JSON values that do not parse as a whole
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# A decoded value counts as a record only if it ends its line or is directly
+# followed by another object or array, as in "{...}{...}"
+_JSON_VALUE_END = re.compile(r"[ \t\r]*(?:\n|\Z|(?=[{\[]))")
+
+# Metadata carried by every transformed record
+_RECORD_METADATA: Dict[str, Any] = {
+    "SchemaVersion": "1.0",
+    "DataClassification": "standard",
+}
+
+# Source fields tried, in order, when a record has no TimeGenerated
+_TIMESTAMP_FIELDS = ("timestamp", "time", "datetime", "event_time")
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Read buffer for streamed S3 bodies; fewer, larger reads keep zlib efficient
+STREAM_BUFFER_SIZE = 128 * 1024
+
+# Parsed batches buffered between download workers and the DCR uploader
+PIPELINE_QUEUE_SIZE = 4
+
+# Leading bytes used to detect gzip compression and JSON content
+GZIP_MAGIC = b"\x1f\x8b"
+JSON_SNIFF_SIZE = 4096
+
+# Starts of JSON documents whose first line does not decode on its own: a
+# lone bracket or an object key (pretty-printed or truncated by the sniff).
+# Bracketed text such as "[2024-02-20 10:00:00] ..." matches none of them.
+_JSON_DOCUMENT_START = re.compile(rb'(?:\[\s*)?(?:[\[{]\s*$|\{\s*")')
+
+# Gzip objects at least this large are spooled to disk and inflated in parallel
+PARALLEL_GZIP_MIN_SIZE = 64 * 1024 * 1024
+
 
 class S3SentinelConnector:
     """Main connector class for S3 to Sentinel data ingestion"""
@@ -40,9 +211,15 @@ class S3SentinelConnector:
         self.dcr_endpoint = os.environ.get("DCR_ENDPOINT")
         self.dcr_rule_id = os.environ.get("DCR_RULE_ID")
         self.dcr_stream_name = os.environ.get("DCR_STREAM_NAME")
+        self.s3_concurrency = int(os.environ.get("S3_CONCURRENCY", "10"))
+        self.dcr_concurrency = int(os.environ.get("DCR_CONCURRENCY", "8"))
 
         # State tracking
-        self.last_processed_key = None
+        self.last_processed_key: Optional[str] = None
+        self.last_modified_after: Optional[datetime] = None
+        self.state_container_name = os.environ.get(
+            "STATE_CONTAINER_NAME", "s3-connector-state"
+        )
         self._state_blob_name = "connector-state.json"
 
         # Initialize clients
@@ -51,6 +228,7 @@ class S3SentinelConnector:
 
         # Load table configuration
         self.table_configs = self._load_table_configs()
+        self._init_parse_state()
 
         # Metrics
         self.metrics = {
@@ -59,17 +237,18 @@ class S3SentinelConnector:
             "bytes_processed": 0,
             "errors": 0,
         }
+        # Downloads run on worker threads, so metric updates are serialized
+        self._metrics_lock = threading.Lock()
+
+    def _increment_metric(self, name: str, value: int = 1) -> None:
+        """Thread-safe increment of a connector metric"""
+        with self._metrics_lock:
+            self.metrics[name] += value
 
     def _init_azure_clients(self):
         """Initialize Azure clients with managed identity"""
         try:
-            # Try managed identity first, fall back to default credential
-            try:
-                credential = ManagedIdentityCredential()
-                # Test the credential
-                credential.get_token("https://vault.azure.net/.default")
-            except Exception:
-                credential = DefaultAzureCredential()
+            credential = self._get_credential()
 
             # Initialize Key Vault client
             if self.key_vault_url:
@@ -94,21 +273,60 @@ class S3SentinelConnector:
                 endpoint=self.dcr_endpoint, credential=credential, logging_enable=True
             )
 
+            # Initialize state storage in the Function App's storage account
+            storage_connection = os.environ.get("AzureWebJobsStorage")
+            if storage_connection:
+                self.state_container: Optional[ContainerClient] = (
+                    ContainerClient.from_connection_string(
+                        storage_connection, self.state_container_name
+                    )
+                )
+            else:
+                self.state_container = None
+                logger.warning(
+                    "AzureWebJobsStorage not configured; state is kept in memory"
+                )
+
             logger.info("Azure clients initialized successfully")
 
         except Exception as e:
             logger.error(f"Failed to initialize Azure clients: {e}")
             raise
 
+    @staticmethod
+    def _get_credential() -> TokenCredential:
+        """Return the process-wide Azure credential, creating it on first use
+
+        Managed identity is tried first and DefaultAzureCredential second.
+        The chain resolves lazily on the first token request, so no probe
+        round-trip is made here.
+        """
+        global _CACHED_CREDENTIAL
+
+        if _CACHED_CREDENTIAL is None:
+            _CACHED_CREDENTIAL = ChainedTokenCredential(
+                ManagedIdentityCredential(), DefaultAzureCredential()
+            )
+        return _CACHED_CREDENTIAL
+
+    def _get_aws_secrets(self) -> Tuple[str, str]:
+        """Fetch AWS keys from Key Vault once per vault for the process"""
+        vault_url = cast(str, self.key_vault_url)
+        cached = _CACHED_AWS_SECRETS.get(vault_url)
+        if cached is None:
+            cached = (
+                self.kv_client.get_secret("aws-access-key-id").value,
+                self.kv_client.get_secret("aws-secret-access-key").value,
+            )
+            _CACHED_AWS_SECRETS[vault_url] = cached
+        return cached
+
     def _init_aws_clients(self):
         """Initialize AWS S3 client with credentials from Key Vault"""
         try:
             # Get credentials from Key Vault
             if self.kv_client:
-                aws_access_key = self.kv_client.get_secret("aws-access-key-id").value
-                aws_secret_key = self.kv_client.get_secret(
-                    "aws-secret-access-key"
-                ).value
+                aws_access_key, aws_secret_key = self._get_aws_secrets()
             else:
                 # Fall back to environment variables for local testing
                 aws_access_key = os.environ.get("AWS_ACCESS_KEY_ID")
@@ -120,8 +338,14 @@ class S3SentinelConnector:
                 aws_access_key_id=aws_access_key,
                 aws_secret_access_key=aws_secret_key,
                 region_name=self.aws_region,
+                # Pool sized for the concurrent download workers; adaptive
+                # retries back off client-side when the bucket throttles
                 config=BotoConfig(
-                    retries={"max_attempts": 3}, connect_timeout=10, read_timeout=30
+                    retries={"max_attempts": 3, "mode": "adaptive"},
+                    connect_timeout=10,
+                    read_timeout=30,
+                    max_pool_connections=self.s3_concurrency * 2,
+                    tcp_keepalive=True,
                 ),
             )
 
@@ -133,7 +357,7 @@ class S3SentinelConnector:
 
     def _load_table_configs(self) -> Dict[str, Dict[str, Any]]:
         """Load table configuration for different log types"""
-        return {
+        configs: Dict[str, Dict[str, Any]] = {
             "firewall": {
                 "table_name": "Custom_Firewall_CL",
                 "required_fields": [
@@ -183,29 +407,49 @@ class S3SentinelConnector:
             },
         }
 
+        return configs
+
+    def _init_parse_state(self) -> None:
+        """Cache lookups for the active log type used on every record"""
+        config = self.table_configs.get(self.log_type, {})
+        transform_map = config.get("transform_map", {})
+
+        self._field_names = tuple(transform_map)
+        self._transform_items = tuple(transform_map.items())
+        self._transform_keys = frozenset(transform_map)
+        self._required = tuple(config.get("required_fields", ()))
+        self._timestamp_formats = tuple(config.get("timestamp_formats", ()))
+
     def list_new_objects(
         self, last_modified_after: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
-        """List S3 objects newer than the specified timestamp"""
+        """List S3 objects newer than the specified timestamp
+
+        Keys at or before ``self.last_processed_key`` are skipped server-side
+        via ``StartAfter``, which assumes keys sort in arrival order (e.g.
+        date-partitioned prefixes).
+        """
         objects = []
 
         try:
+            paginate_kwargs: Dict[str, Any] = {
+                "Bucket": self.s3_bucket,
+                "Prefix": self.s3_prefix,
+                "PaginationConfig": {"PageSize": 1000},
+            }
+            if self.last_processed_key:
+                paginate_kwargs["StartAfter"] = self.last_processed_key
+
             paginator = self.s3_client.get_paginator("list_objects_v2")
-            page_iterator = paginator.paginate(
-                Bucket=self.s3_bucket,
-                Prefix=self.s3_prefix,
-                PaginationConfig={"MaxItems": 1000},
-            )
+            page_iterator = paginator.paginate(**paginate_kwargs)
 
             for page in page_iterator:
-                if "Contents" not in page:
-                    continue
-
-                for obj in page["Contents"]:
-                    # Skip if older than last processed
+                for obj in page.get("Contents", ()):
+                    # Skip if older than last processed; ties are kept since
+                    # StartAfter already excludes the last processed key
                     if (
                         last_modified_after
-                        and obj["LastModified"] <= last_modified_after
+                        and obj["LastModified"] < last_modified_after
                     ):
                         continue
 
@@ -233,154 +477,255 @@ class S3SentinelConnector:
 
         except ClientError as e:
             logger.error(f"Failed to list S3 objects: {e}")
-            self.metrics["errors"] += 1
+            self._increment_metric("errors")
             raise
 
     def _is_valid_file(self, key: str) -> bool:
         """Check if file should be processed based on extension and patterns"""
-        valid_extensions = [".log", ".json", ".gz", ".csv", ".txt"]
-        excluded_patterns = ["temp", "partial", "incomplete", "_tmp"]
+        return _VALID_FILE_RE.fullmatch(key) is not None
 
-        # Check extension
-        if not any(key.lower().endswith(ext) for ext in valid_extensions):
-            return False
+    def download_and_parse(self, obj: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Download an S3 object and parse its contents"""
+        records: List[Dict[str, Any]] = []
+        if not self._stream_object(obj, records.extend):
+            return []
+        return records
 
-        # Check for excluded patterns
-        if any(pattern in key.lower() for pattern in excluded_patterns):
-            return False
+    def _stream_object(
+        self, obj: Dict[str, Any], emit: Callable[[List[Dict[str, Any]]], None]
+    ) -> bool:
+        """Download and parse an S3 object, emitting records in batch_size lists
 
-        return True
+        The body is streamed and decompressed through a buffered reader, so
+        neither the compressed nor the decompressed file is held in memory.
 
-    def download_and_parse(self, obj: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Download an S3 object and parse its contents"""
+        Returns:
+            True if the whole object was processed, False on failure
+        """
         key = obj["Key"]
 
         try:
             # Download object
             response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=key)
-            content = response["Body"].read()
-
-            # Decompress if needed
-            if key.endswith(".gz"):
-                content = gzip.decompress(content)
-
-            # Decode
-            text_content = content.decode("utf-8", errors="replace")
+            body = io.BufferedReader(response["Body"], buffer_size=STREAM_BUFFER_SIZE)
+
+            with body, self._open_stream(body, obj["Size"]) as stream:
+                # The key or content type names JSON, or the content itself
+                # does; JSON decoders take bytes directly
+                if (
+                    ".json" in key
+                    or "json" in response.get("ContentType", "")
+                    or self._is_json_stream(stream)
+                ):
+                    records = self._parse_json(stream)
+                else:
+                    records = self._parse_delimited(
+                        io.TextIOWrapper(
+                            stream, encoding="utf-8", errors="replace", newline="\n"
+                        )
+                    )
 
-            # Parse based on file type
-            if key.endswith(".json") or key.endswith(".json.gz"):
-                records = self._parse_json(text_content)
-            else:
-                records = self._parse_delimited(text_content)
+                while batch := list(islice(records, self.batch_size)):
+                    emit(batch)
 
-            self.metrics["files_processed"] += 1
-            self.metrics["bytes_processed"] += obj["Size"]
+            self._increment_metric("files_processed")
+            self._increment_metric("bytes_processed", obj["Size"])
 
-            return records
+            return True
 
         except ClientError as e:
             logger.error(f"Failed to download {key}: {e}")
-            self.metrics["errors"] += 1
-            return []
+            self._increment_metric("errors")
+            return False
         except Exception as e:
             logger.error(f"Failed to parse {key}: {e}")
-            self.metrics["errors"] += 1
-            return []
+            self._increment_metric("errors")
+            return False
 
-    def _parse_json(self, content: str) -> List[Dict[str, Any]]:
-        """Parse JSON log content"""
-        records = []
-        config = self.table_configs.get(self.log_type, {})
-        transform_map = config.get("transform_map", {})
+    @staticmethod
+    @contextmanager
+    def _open_stream(
+        body: io.BufferedReader, size: int
+    ) -> Iterator[Union[io.BufferedReader, gzip.GzipFile]]:
+        """Wrap a buffered S3 body in a decompressing reader if it is gzipped
+
+        Compression is detected from the gzip magic bytes rather than the
+        key suffix, so misnamed objects are handled either way. Objects of
+        PARALLEL_GZIP_MIN_SIZE or more are downloaded to a temporary file
+        first, since rapidgzip needs a seekable source.
+        """
+        if body.peek(2)[:2] != GZIP_MAGIC:
+            yield body
+        elif rapidgzip is None or size < PARALLEL_GZIP_MIN_SIZE:
+            with _GzipFile(fileobj=body) as stream:
+                yield stream
+        else:
+            with tempfile.TemporaryFile() as spool:
+                shutil.copyfileobj(body, spool, STREAM_BUFFER_SIZE)
+                spool.seek(0)
+                parallel = rapidgzip.open(spool, parallelization=os.cpu_count() or 1)
+                with io.BufferedReader(parallel, STREAM_BUFFER_SIZE) as stream:
+                    yield stream
+
+    @staticmethod
+    def _is_json_stream(stream: Union[io.BufferedReader, gzip.GzipFile]) -> bool:
+        """Check whether a stream starts with a JSON object or array
+
+        A leading bracket alone is not enough (bracketed syslog timestamps
+        start the same way): the first line must decode to an object or
+        array, or open one in an unambiguously JSON way.
+        """
+        head = stream.peek(JSON_SNIFF_SIZE).lstrip()
+        if head[:1] not in (b"{", b"["):
+            return False
 
+        first_line = head.split(b"\n", 1)[0].rstrip()
         try:
-            # Try parsing as JSON array first
-            data = json.loads(content)
-            if isinstance(data, list):
-                items = data
-            else:
-                items = [data]
-
-            for item in items:
-                record = self._transform_record(item, transform_map, config)
-                if record:
-                    records.append(record)
-
-        except json.JSONDecodeError:
-            # Try NDJSON (newline-delimited JSON)
-            for line in content.strip().split("\n"):
-                if not line.strip():
-                    continue
-                try:
-                    item = json.loads(line)
-                    record = self._transform_record(item, transform_map, config)
-                    if record:
-                        records.append(record)
-                except json.JSONDecodeError:
-                    continue
+            if isinstance(_json_loads_bytes(first_line), (dict, list)):
+                return True
+        except ValueError:
+            pass
+        return _JSON_DOCUMENT_START.match(first_line) is not None
+
+    def _parse_json(self, stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+        """Parse JSON, JSON array or NDJSON log content"""
+        for item in self._iter_json_items(stream):
+            # Scalars and nested arrays are not records
+            if not isinstance(item, dict):
+                continue
+            record = self._transform_record(item)
+            if record:
+                yield record
 
-        return records
+    def _iter_json_items(self, stream: IO[bytes]) -> Iterator[Any]:
+        """Yield source items from a JSON document or an NDJSON stream
 
-    def _parse_delimited(self, content: str) -> List[Dict[str, Any]]:
-        """Parse pipe or comma-delimited log content"""
-        records = []
-        config = self.table_configs.get(self.log_type, {})
-        transform_map = config.get("transform_map", {})
+        The first non-whitespace character picks the path: a line holding a
+        complete object starts NDJSON, which is then streamed line by line;
+        anything else (typically an array) is parsed as one document.
+        """
+        first_line = next((line for line in stream if line.strip()), b"")
 
-        lines = content.strip().split("\n")
+        if first_line.lstrip()[:1] == b"{":
+            try:
+                data = _json_loads_bytes(first_line)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                yield data
+                yield from self._iter_ndjson(stream)
+                return
+
+        # Single (possibly multi-line) document
+        content = first_line + stream.read()
+        try:
+            data = _json_loads_bytes(content)
+        except ValueError:
+            yield from self._iter_concatenated_json(
+                content.decode("utf-8", errors="replace")
+            )
+            return
+        yield from data if isinstance(data, list) else (data,)
 
+    @staticmethod
+    def _iter_ndjson(lines: Iterable[bytes]) -> Iterator[Any]:
+        """Yield items from newline-delimited JSON, skipping invalid lines"""
         for line in lines:
             if not line.strip():
                 continue
+            try:
+                yield _json_loads_bytes(line)
+            except ValueError:
+                continue
 
-            # Detect delimiter
-            if "|" in line:
-                fields = line.split("|")
-            elif "," in line:
-                fields = line.split(",")
-            else:
-                fields = line.split()
-
-            # Map fields based on position (assuming standard order)
-            field_names = list(transform_map.keys())
-            item = {}
-
-            for i, value in enumerate(fields):
-                if i < len(field_names):
-                    item[field_names[i]] = value.strip()
+    @staticmethod
+    def _iter_concatenated_json(content: str) -> Iterator[Any]:
+        """Yield items from concatenated JSON values in an already-read string
+
+        Walks the buffer with raw_decode instead of splitting it into one
+        substring per line. A value must end its line or be followed by
+        another object or array; otherwise (e.g. the ``123`` prefix of
+        ``123abc``) the line is bad and, like undecodable input, is skipped
+        to the next newline.
+        """
+        decode = _JSON_DECODER.raw_decode
+        value_tail = _JSON_VALUE_END.match
+        end = len(content)
+        pos = _JSON_WHITESPACE.match(content).end()
+
+        while pos < end:
+            try:
+                item, value_end = decode(content, pos)
+                tail = value_tail(content, value_end)
+            except ValueError:
+                tail = None
 
-            record = self._transform_record(item, transform_map, config)
+            if tail is None:
+                newline = content.find("\n", pos)
+                if newline == -1:
+                    return
+                pos = newline + 1
+            else:
+                yield item
+                pos = tail.end()
+            pos = _JSON_WHITESPACE.match(content, pos).end()
+
+    def _parse_delimited(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Parse pipe or comma-delimited log content
+
+        The delimiter is detected once from the first non-empty line. Pipe
+        and comma lines holding a quote go through csv.reader one physical
+        line at a time, so quoted fields are honoured but a stray quote
+        cannot swallow the lines after it.
+        """
+        # Map fields based on position (assuming standard order)
+        field_names = self._field_names
+
+        non_empty = (line for line in lines if line.strip())
+        first_line = next(non_empty, None)
+        if first_line is None:
+            return
+        all_lines = chain((first_line,), non_empty)
+
+        # Detect delimiter
+        rows: Iterable[List[str]]
+        if "|" in first_line:
+            rows = (_split_delimited(line, "|") for line in all_lines)
+        elif "," in first_line:
+            rows = (_split_delimited(line, ",") for line in all_lines)
+        else:
+            rows = (line.split() for line in all_lines)
+
+        for row in rows:
+            item = dict(zip(field_names, map(str.strip, row)))
+
+            record = self._transform_record(item)
             if record:
-                records.append(record)
+                yield record
 
-        return records
-
-    def _transform_record(
-        self,
-        item: Dict[str, Any],
-        transform_map: Dict[str, str],
-        config: Dict[str, Any],
-    ) -> Optional[Dict[str, Any]]:
+    def _transform_record(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Transform a source record to Sentinel schema"""
-        record = {}
+        # Start from the shared metadata so it is not inserted per record
+        record = _RECORD_METADATA.copy()
+        transform_keys = self._transform_keys
 
         # Apply field mappings
-        for source, target in transform_map.items():
+        for source, target in self._transform_items:
             if source in item:
                 record[target] = item[source]
 
         # Copy fields that already match target names
         for key, value in item.items():
-            if key not in transform_map:
+            if key not in transform_keys:
                 record.setdefault(key, value)
 
         # Ensure TimeGenerated exists
         if "TimeGenerated" not in record:
             # Try to find a timestamp field
-            for ts_field in ["timestamp", "time", "datetime", "event_time"]:
+            for ts_field in _TIMESTAMP_FIELDS:
                 if ts_field in item:
                     record["TimeGenerated"] = self._parse_timestamp(
-                        item[ts_field], config.get("timestamp_formats", [])
+                        item[ts_field], self._timestamp_formats
                     )
                     break
             else:
@@ -388,33 +733,78 @@ class S3SentinelConnector:
                 record["TimeGenerated"] = datetime.now(timezone.utc).isoformat()
 
         # Validate required fields
-        required = config.get("required_fields", [])
-        for field in required:
-            if field not in record or record[field] is None:
+        for field in self._required:
+            if record.get(field) is None:
                 return None
 
-        # Add metadata
-        record["SchemaVersion"] = "1.0"
-        record["DataClassification"] = "standard"
-
         return record
 
-    def _parse_timestamp(self, ts_str: str, formats: List[str]) -> str:
+    def _parse_timestamp(self, ts_str: str, formats: Tuple[str, ...]) -> str:
         """Parse timestamp string to ISO format"""
         if not ts_str:
             return datetime.now(timezone.utc).isoformat()
 
+        ts_str = str(ts_str)
+        dt = self._parse_timestamp_fast(ts_str, formats)
+
+        if dt is None:
+            for fmt in formats:
+                try:
+                    dt = datetime.strptime(ts_str, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                # Return as-is if no format matches
+                return ts_str
+
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.isoformat()
+
+    @staticmethod
+    def _parse_timestamp_fast(
+        ts_str: str, formats: Tuple[str, ...]
+    ) -> Optional[datetime]:
+        """Parse common timestamp shapes without strptime; None if unmatched
+
+        Configured formats are walked in order and only their own shapes are
+        tried. The first format without a known shape hands over to strptime
+        so the configured precedence is kept; None means "use strptime".
+        """
         for fmt in formats:
-            try:
-                dt = datetime.strptime(str(ts_str), fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt.isoformat()
-            except ValueError:
-                continue
+            shape = _ISO_FORMAT_SHAPES.get(fmt)
+            if shape is not None:
+                match = shape.fullmatch(ts_str)
+                if not match:
+                    continue
+                year, month, day, hour, minute, second, fraction = match.groups()
+                try:
+                    return datetime(
+                        int(year),
+                        int(month),
+                        int(day),
+                        int(hour),
+                        int(minute),
+                        int(second),
+                        int(fraction.ljust(6, "0")) if fraction else 0,
+                    )
+                except ValueError:
+                    return None
+
+            if fmt != _MONTH_DAY_YEAR_FORMAT:
+                return None
+
+            match = _MONTH_DAY_YEAR_RE.fullmatch(ts_str)
+            month = match and _MONTH_NUMBERS.get(match.group(1).lower())
+            if match and month:
+                day, year, hour, minute, second = map(int, match.groups()[1:])
+                try:
+                    return datetime(year, month, day, hour, minute, second)
+                except ValueError:
+                    return None
 
-        # Return as-is if no format matches
-        return str(ts_str)
+        return None
 
     def ingest_to_sentinel(self, records: List[Dict[str, Any]]) -> int:
         """Ingest records to Sentinel via DCR"""
@@ -445,11 +835,11 @@ class S3SentinelConnector:
 
             except AzureError as e:
                 logger.error(f"Failed to ingest batch: {e}")
-                self.metrics["errors"] += 1
+                self._increment_metric("errors")
                 # Store failed batch for retry
                 self._store_failed_batch(batch, str(e))
 
-        self.metrics["records_ingested"] += ingested
+        self._increment_metric("records_ingested", ingested)
         return ingested
 
     def _store_failed_batch(self, batch: List[Dict[str, Any]], error: str):
@@ -461,13 +851,164 @@ class S3SentinelConnector:
         # In production, this would write to blob storage for retry
         # For now, just log the failure
 
+    def _upload_batches(
+        self,
+        batches: "queue.Queue[Optional[Tuple[str, List[Dict[str, Any]]]]]",
+        failed_keys: Set[str],
+    ) -> None:
+        """Upload queued (object key, records) batches until the None sentinel
+
+        Batches from small objects are coalesced so every upload except the
+        last carries a full batch_size of records. Up to dcr_concurrency
+        uploads run at once; when all slots are busy this thread stops
+        draining the queue, which in turn pauses the download workers.
+        Keys of objects with records in a failed upload are added to
+        ``failed_keys`` before this returns.
+        """
+        slots = threading.BoundedSemaphore(self.dcr_concurrency)
+        submitted: List[Tuple["Future[bool]", Set[str]]] = []
+
+        def submit(records: List[Dict[str, Any]], sources: Set[str]) -> None:
+            slots.acquire()
+            future = uploads.submit(self._ingest_pending, records)
+            future.add_done_callback(lambda _: slots.release())
+            submitted.append((future, sources))
+
+        with ThreadPoolExecutor(
+            max_workers=self.dcr_concurrency, thread_name_prefix="dcr-upload"
+        ) as uploads:
+            pending: List[Dict[str, Any]] = []
+            # Source object key of each pending record
+            pending_keys: List[str] = []
+            while (item := batches.get()) is not None:
+                key, batch = item
+                pending.extend(batch)
+                pending_keys.extend(repeat(key, len(batch)))
+                while len(pending) >= self.batch_size:
+                    submit(
+                        pending[: self.batch_size],
+                        set(pending_keys[: self.batch_size]),
+                    )
+                    pending = pending[self.batch_size :]
+                    pending_keys = pending_keys[self.batch_size :]
+
+            if pending:
+                submit(pending, set(pending_keys))
+
+        for future, sources in submitted:
+            if not future.result():
+                failed_keys.update(sources)
+
+    def _ingest_pending(self, records: List[Dict[str, Any]]) -> bool:
+        """Ingest records on an upload thread without letting it die
+
+        Returns:
+            True if every record was ingested
+        """
+        try:
+            return self.ingest_to_sentinel(records) == len(records)
+        except Exception as e:
+            # Keep draining so producers never block on a dead consumer
+            logger.error(f"Failed to ingest batch: {e}")
+            self._increment_metric("errors")
+            return False
+
+    def _load_state(self) -> None:
+        """Restore the listing checkpoint saved by the previous run
+
+        Falls back to the in-memory checkpoint of a warm instance when no
+        state has been saved yet or the state blob cannot be read.
+        """
+        if self.state_container is None:
+            return
+
+        try:
+            blob = self.state_container.get_blob_client(self._state_blob_name)
+            state = _json_loads_bytes(blob.download_blob().readall())
+            last_key = state.get("last_key")
+            last_modified = state.get("last_modified")
+            if last_modified:
+                last_modified = datetime.fromisoformat(last_modified)
+        except ResourceNotFoundError:
+            return
+        except (AzureError, AttributeError, TypeError, ValueError) as e:
+            # A corrupt state blob must not fail every run
+            logger.warning(f"Failed to load connector state: {e}")
+            return
+
+        if last_key:
+            self.last_processed_key = last_key
+        if last_modified:
+            self.last_modified_after = last_modified
+
+    @staticmethod
+    def _checkpoint_object(
+        objects: List[Dict[str, Any]], succeeded: List[bool]
+    ) -> Optional[Dict[str, Any]]:
+        """Pick the object the listing checkpoint can safely advance to
+
+        ``objects`` is in listing (key) order. The checkpoint stays within the
+        leading run of successfully processed objects, so a failed object is
+        listed again next time, and it never passes an object whose
+        LastModified is newer than a later, unprocessed one, which the
+        LastModified filter would otherwise skip.
+        """
+        # Oldest LastModified among each object's successors
+        later_oldest: List[Optional[datetime]] = [None] * len(objects)
+        oldest: Optional[datetime] = None
+        for index in range(len(objects) - 1, -1, -1):
+            later_oldest[index] = oldest
+            modified = objects[index]["LastModified"]
+            if oldest is None or modified < oldest:
+                oldest = modified
+
+        checkpoint = None
+        for obj, ok, after in zip(objects, succeeded, later_oldest):
+            if not ok:
+                break
+            if after is None or obj["LastModified"] <= after:
+                checkpoint = obj
+        return checkpoint
+
+    def _save_state(self, checkpoint: Dict[str, Any]) -> None:
+        """Advance the listing checkpoint to a processed object
+
+        Key and LastModified are both taken from ``checkpoint``. The state
+        blob is replaced with a single Put Blob, so a reader sees either the
+        previous checkpoint or the new one, never a partial write.
+        """
+        self.last_processed_key = checkpoint["Key"]
+        self.last_modified_after = checkpoint["LastModified"]
+
+        if self.state_container is None:
+            return
+
+        state = json.dumps(
+            {
+                "last_modified": self.last_modified_after.isoformat(),
+                "last_key": self.last_processed_key,
+            }
+        )
+        blob = self.state_container.get_blob_client(self._state_blob_name)
+        try:
+            try:
+                blob.upload_blob(state, overwrite=True)
+            except ResourceNotFoundError:
+                # First run against this storage account
+                self.state_container.create_container()
+                blob.upload_blob(state, overwrite=True)
+        except AzureError as e:
+            logger.error(f"Failed to save connector state: {e}")
+            self._increment_metric("errors")
+
     def run(self) -> Dict[str, Any]:
         """Main execution method"""
         start_time = datetime.now(timezone.utc)
 
         try:
-            # List new objects
-            objects = self.list_new_objects()
+            # List objects added since the saved checkpoint
+            self._load_state()
+            objects = self.list_new_objects(self.last_modified_after)
 
             if not objects:
                 logger.info("No new objects to process")
@@ -477,20 +1018,43 @@ class S3SentinelConnector:
                     "metrics": self.metrics,
                 }
 
-            # Process each object
-            all_records = []
-            for obj in objects:
-                records = self.download_and_parse(obj)
-                all_records.extend(records)
-
-                # Ingest in chunks to avoid memory issues
-                if len(all_records) >= self.batch_size * 5:
-                    self.ingest_to_sentinel(all_records)
-                    all_records = []
-
-            # Ingest remaining records
-            if all_records:
-                self.ingest_to_sentinel(all_records)
+            # Download workers feed parsed batches through a bounded queue to a
+            # single uploader thread, overlapping S3 reads with DCR uploads
+            batches: "queue.Queue[Optional[Tuple[str, List[Dict[str, Any]]]]]" = (
+                queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+            )
+            failed_uploads: Set[str] = set()
+            uploader = threading.Thread(
+                target=self._upload_batches,
+                args=(batches, failed_uploads),
+                name="dcr-uploader",
+            )
+            uploader.start()
+            try:
+                with ThreadPoolExecutor(max_workers=self.s3_concurrency) as executor:
+                    futures = [
+                        executor.submit(
+                            self._stream_object,
+                            obj,
+                            lambda records, key=obj["Key"]: batches.put((key, records)),
+                        )
+                        for obj in objects
+                    ]
+                    streamed = [future.result() for future in futures]
+            finally:
+                batches.put(None)
+                uploader.join()
+
+            # An object is done once it was both downloaded and uploaded.
+            # Resume listing after the done objects on the next invocation;
+            # failed objects stay ahead of the checkpoint
+            succeeded = [
+                ok and obj["Key"] not in failed_uploads
+                for obj, ok in zip(objects, streamed)
+            ]
+            checkpoint = self._checkpoint_object(objects, succeeded)
+            if checkpoint is not None:
+                self._save_state(checkpoint)
 
             duration = (datetime.now(timezone.utc) - start_time).total_seconds()
 
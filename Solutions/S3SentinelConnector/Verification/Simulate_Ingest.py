@@ -16,8 +16,10 @@ Requirements:
 
 import argparse
 import json
+import re
 import sys
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any, Dict, List, cast
 
 try:
@@ -30,6 +32,44 @@ except ImportError:
     sys.exit(1)
 
 
+# Accepted TimeGenerated shape; the captured fields are then range-checked
+_ISO_TIMESTAMP_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?"
+    r"(?:Z|[+-](\d{2}):(\d{2}))",
+    re.ASCII,
+)
+
+
+def _is_valid_iso_timestamp(timestamp: Any) -> bool:
+    """Check a TimeGenerated value is a real ISO 8601 date and time
+
+    The common shape is matched by regex and its fields are range-checked
+    with the datetime constructor; anything else goes to fromisoformat.
+    """
+    match = (
+        _ISO_TIMESTAMP_RE.fullmatch(timestamp) if isinstance(timestamp, str) else None
+    )
+    if match is None:
+        try:
+            datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            return False
+        return True
+
+    year, month, day, hour, minute, second, offset_hours, offset_minutes = (
+        match.groups()
+    )
+    if offset_hours is not None and (
+        int(offset_hours) > 23 or int(offset_minutes) > 59
+    ):
+        return False
+    try:
+        datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+    except ValueError:
+        return False
+    return True
+
+
 class DataCollectorSimulator:
     """Simulate data ingestion to Azure Monitor via DCR"""
 
@@ -71,19 +111,18 @@ class DataCollectorSimulator:
             List of validation error messages (empty if valid)
         """
         errors = []
-        required_fields = schema.get("required_fields", [])
+        required_fields = tuple(schema.get("required_fields", []))
 
         for i, log in enumerate(logs):
             for field in required_fields:
-                if field not in log or log[field] is None:
+                if log.get(field) is None:
                     errors.append(f"Log {i}: Missing required field '{field}'")
 
             # Validate TimeGenerated format
-            if "TimeGenerated" in log:
-                try:
-                    datetime.fromisoformat(log["TimeGenerated"].replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    errors.append(f"Log {i}: Invalid TimeGenerated format")
+            if "TimeGenerated" in log and not _is_valid_iso_timestamp(
+                log["TimeGenerated"]
+            ):
+                errors.append(f"Log {i}: Invalid TimeGenerated format")
 
         return errors
 
@@ -102,15 +141,15 @@ class DataCollectorSimulator:
         """
         results = {"total": len(logs), "successful": 0, "failed": 0, "errors": []}
 
-        # Ensure TimeGenerated is set
-        for log in logs:
-            if "TimeGenerated" not in log:
-                log["TimeGenerated"] = datetime.now(timezone.utc).isoformat()
+        # Process in batches, defaulting TimeGenerated as each batch is cut
+        now = datetime.now(timezone.utc).isoformat()
+        pending = iter(logs)
+        batch_num = 0
 
-        # Process in batches
-        for i in range(0, len(logs), batch_size):
-            batch = logs[i : i + batch_size]
-            batch_num = i // batch_size + 1
+        while batch := list(islice(pending, batch_size)):
+            batch_num += 1
+            for log in batch:
+                log.setdefault("TimeGenerated", now)
 
             try:
                 # Cast to List[Any] to satisfy the JSON type requirement
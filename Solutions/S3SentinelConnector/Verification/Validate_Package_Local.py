@@ -1,12 +1,118 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
+from jsonschema import Draft7Validator, ValidationError
+
+# orjson parses straight from bytes; stdlib json accepts bytes as well
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
+REQUIRED_CONTENT_TYPES: frozenset[str] = frozenset({"DataConnector", "Workbook", "AnalyticsRule"})
+
+REQUIRED_ARTIFACTS: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("DataConnector", "Data Connectors/"),
+        ("Workbook", "Workbooks/"),
+        ("AnalyticsRule", "Analytic Rules/"),
+    }
+)
+
+WORKBOOK_TEMPLATE_REQUIRED: frozenset[str] = frozenset({"version", "name", "description", "author", "source"})
+
+# A tuple, not a set: missing fields are reported in this order
+ANALYTIC_RULE_REQUIRED: tuple[str, ...] = (
+    "id",
+    "name",
+    "description",
+    "severity",
+    "status",
+    "requiredDataConnectors",
+    "queryFrequency",
+    "queryPeriod",
+    "triggerOperator",
+    "triggerThreshold",
+    "tactics",
+    "relevantTechniques",
+    "query",
+    "kind",
+    "version",
+)
+
+WORKBOOK_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["$schema", "version", "items"],
+    "properties": {
+        "$schema": {"type": "string", "pattern": "schema/workbook\\.json"},
+        "version": {"const": "Notebook/1.0"},
+        "items": {"type": "array"},
+    },
+}
+
+WORKBOOK_METADATA_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["isTemplate", "templateData"],
+    "properties": {
+        "isTemplate": {"const": True},
+        "templateData": {
+            "type": "object",
+            "required": sorted(WORKBOOK_TEMPLATE_REQUIRED),
+        },
+    },
+}
+
+ANALYTIC_RULE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": list(ANALYTIC_RULE_REQUIRED),
+}
+
+RELEASE_NOTES_TABLE_HEADER = "| **Version** | **Date Modified (DD-MM-YYYY)** | **Change History** |".encode("utf-8")
+
+_MARKDOWN_CELL_ESCAPES = str.maketrans({"|": "\\|"})
+
+# Validators are built once at import and reused for every run
+_WORKBOOK_VALIDATOR = Draft7Validator(WORKBOOK_SCHEMA)
+_WORKBOOK_METADATA_VALIDATOR = Draft7Validator(WORKBOOK_METADATA_SCHEMA)
+_ANALYTIC_RULE_VALIDATOR = Draft7Validator(ANALYTIC_RULE_SCHEMA)
+
+
+def _file_contains(file_path: Path, *needles: bytes) -> list[bool]:
+    # Map the file once and search the bytes for every needle, instead of
+    # decoding it to str or re-reading it per check
+    with open(file_path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            # mmap cannot map an empty file; only an empty needle matches
+            return [not needle for needle in needles]
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return [content.find(needle) != -1 for needle in needles]
+
+
+def _schema_errors(validator: Draft7Validator, instance: Any) -> list[ValidationError]:
+    return list(validator.iter_errors(instance))
+
+
+def _missing_required(errors: list[ValidationError], path: tuple[Any, ...] = ()) -> list[str]:
+    """Required keys reported missing from the object at ``path``, in schema order."""
+    missing: list[str] = []
+    for error in errors:
+        if error.validator == "required" and tuple(error.path) == path:
+            missing.extend(key for key in error.validator_value if key not in error.instance and key not in missing)
+    return missing
 
 
 @dataclass
@@ -20,6 +126,8 @@ class LocalPackageValidator:
     def __init__(self, solution_root: Path) -> None:
         self.solution_root = solution_root
         self.results: list[CheckResult] = []
+        self.passed_count = 0
+        self.failed_count = 0
 
         self.package_file = self.solution_root / "Package.json"
         self.metadata_file = self.solution_root / "Metadata.json"
@@ -27,6 +135,17 @@ class LocalPackageValidator:
         self.workbook_file = self.solution_root / "Workbooks" / "S3SentinelConnector_OperationalOverview.json"
         self.workbook_metadata_file = self.solution_root / "Workbooks" / "S3SentinelConnector_OperationalOverview.metadata.json"
         self.analytic_rule_file = self.solution_root / "Analytic Rules" / "S3SentinelConnector_HighVolumeFirewallDenies.yaml"
+        template_specs_dir = self.solution_root / "TemplateSpecs"
+        self.required_files = (
+            self.package_file,
+            self.metadata_file,
+            self.release_notes_file,
+            self.workbook_file,
+            self.workbook_metadata_file,
+            self.analytic_rule_file,
+            template_specs_dir / "mainTemplate.json",
+            template_specs_dir / "createUiDefinition.json",
+        )
 
     def run(self) -> int:
         self._check_required_files_exist()
@@ -54,48 +173,52 @@ class LocalPackageValidator:
             self._check_release_notes_format(package_json)
 
         report_file = self._write_report()
-        passed = sum(1 for result in self.results if result.passed)
-        failed = len(self.results) - passed
-        print(f"Validation complete: {passed} passed, {failed} failed")
+        print(f"Validation complete: {self.passed_count} passed, {self.failed_count} failed")
         print(f"Report: {report_file}")
-        return 0 if failed == 0 else 1
+        return 0 if self.failed_count == 0 else 1
+
+    def _record(self, name: str, passed: bool, details: str) -> None:
+        self.results.append(CheckResult(name=name, passed=passed, details=details))
+        if passed:
+            self.passed_count += 1
+        else:
+            self.failed_count += 1
 
     def _check_required_files_exist(self) -> None:
-        required = [
-            self.package_file,
-            self.metadata_file,
-            self.release_notes_file,
-            self.workbook_file,
-            self.workbook_metadata_file,
-            self.analytic_rule_file,
-            self.solution_root / "TemplateSpecs" / "mainTemplate.json",
-            self.solution_root / "TemplateSpecs" / "createUiDefinition.json",
+        required = self.required_files
+        # One directory listing per parent instead of one stat per file
+        names_by_parent: dict[Path, set[str]] = {}
+        for parent in {path.parent for path in required}:
+            try:
+                with os.scandir(parent) as entries:
+                    names_by_parent[parent] = {entry.name for entry in entries}
+            except OSError:
+                names_by_parent[parent] = set()
+        missing = [
+            str(path.relative_to(self.solution_root)) for path in required if path.name not in names_by_parent[path.parent]
         ]
-        missing = [str(path.relative_to(self.solution_root)) for path in required if not path.exists()]
-        self.results.append(
-            CheckResult(
-                name="Required artifact files exist",
-                passed=len(missing) == 0,
-                details="All required files found" if not missing else f"Missing: {', '.join(missing)}",
-            )
+        self._record(
+            name="Required artifact files exist",
+            passed=len(missing) == 0,
+            details="All required files found" if not missing else f"Missing: {', '.join(missing)}",
         )
 
     def _safe_read_json(self, file_path: Path, name: str) -> dict[str, Any] | None:
         try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
-            self.results.append(CheckResult(name=name, passed=True, details="Parsed successfully"))
+            data = _json_loads(file_path.read_bytes())
+            self._record(name=name, passed=True, details="Parsed successfully")
             return data
         except Exception as exc:
-            self.results.append(CheckResult(name=name, passed=False, details=str(exc)))
+            self._record(name=name, passed=False, details=str(exc))
             return None
 
     def _safe_read_yaml(self, file_path: Path, name: str) -> dict[str, Any] | None:
         try:
-            data = yaml.safe_load(file_path.read_text(encoding="utf-8"))
-            self.results.append(CheckResult(name=name, passed=True, details="Parsed successfully"))
+            data = yaml.load(file_path.read_text(encoding="utf-8"), Loader=_YamlLoader)
+            self._record(name=name, passed=True, details="Parsed successfully")
             return data
         except Exception as exc:
-            self.results.append(CheckResult(name=name, passed=False, details=str(exc)))
+            self._record(name=name, passed=False, details=str(exc))
             return None
 
     def _check_version_and_publish_date_alignment(self, package: dict[str, Any], metadata: dict[str, Any]) -> None:
@@ -104,134 +227,91 @@ class LocalPackageValidator:
         package_date = package.get("LastPublishDate")
         metadata_date = metadata.get("LastPublishDate")
 
-        self.results.append(
-            CheckResult(
-                name="Version alignment (Package.json vs Metadata.json)",
-                passed=package_version == metadata_version,
-                details=f"Package={package_version}, Metadata={metadata_version}",
-            )
+        self._record(
+            name="Version alignment (Package.json vs Metadata.json)",
+            passed=package_version == metadata_version,
+            details=f"Package={package_version}, Metadata={metadata_version}",
         )
-        self.results.append(
-            CheckResult(
-                name="LastPublishDate alignment",
-                passed=package_date == metadata_date,
-                details=f"Package={package_date}, Metadata={metadata_date}",
-            )
+        self._record(
+            name="LastPublishDate alignment",
+            passed=package_date == metadata_date,
+            details=f"Package={package_date}, Metadata={metadata_date}",
         )
 
     def _check_content_types(self, package: dict[str, Any]) -> None:
-        required_types = {"DataConnector", "Workbook", "AnalyticsRule"}
-        actual = set(package.get("contentTypes", []))
-        missing = sorted(required_types - actual)
-        self.results.append(
-            CheckResult(
-                name="Package contentTypes include required types",
-                passed=not missing,
-                details="All required types present" if not missing else f"Missing: {', '.join(missing)}",
-            )
+        missing = sorted(REQUIRED_CONTENT_TYPES.difference(package.get("contentTypes", [])))
+        self._record(
+            name="Package contentTypes include required types",
+            passed=not missing,
+            details="All required types present" if not missing else f"Missing: {', '.join(missing)}",
         )
 
     def _check_artifacts(self, package: dict[str, Any]) -> None:
-        artifacts = package.get("artifacts", [])
-        required_artifacts = {
-            ("DataConnector", "Data Connectors/"),
-            ("Workbook", "Workbooks/"),
-            ("AnalyticsRule", "Analytic Rules/"),
-        }
         found_artifacts: set[tuple[str, str]] = set()
-        for item in artifacts:
-            if not isinstance(item, dict):
+        for item in package.get("artifacts", []):
+            # Malformed entries are rare; non-mapping or unhashable parts raise TypeError
+            try:
+                found_artifacts.add((item["type"], item["source"]["path"]))
+            except (KeyError, TypeError):
                 continue
-            item_type = item.get("type")
-            source_path = item.get("source", {}).get("path") if isinstance(item.get("source"), dict) else None
-            if isinstance(item_type, str) and isinstance(source_path, str):
-                found_artifacts.add((item_type, source_path))
-        missing = sorted(required_artifacts - found_artifacts)
-        self.results.append(
-            CheckResult(
-                name="Package artifacts include required paths",
-                passed=not missing,
-                details="All required artifact mappings present" if not missing else f"Missing: {missing}",
-            )
+        missing = sorted(REQUIRED_ARTIFACTS - found_artifacts)
+        self._record(
+            name="Package artifacts include required paths",
+            passed=not missing,
+            details="All required artifact mappings present" if not missing else f"Missing: {missing}",
         )
 
     def _check_workbook_shape(self, workbook: dict[str, Any]) -> None:
+        errors = _schema_errors(_WORKBOOK_VALIDATOR, workbook)
         schema = str(workbook.get("$schema", ""))
         version = workbook.get("version")
         items = workbook.get("items")
-        self.results.append(
-            CheckResult(
-                name="Workbook schema/version shape",
-                passed=("schema/workbook.json" in schema and version == "Notebook/1.0" and isinstance(items, list)),
-                details=f"schema={schema}, version={version}, items_type={type(items).__name__}",
-            )
+        self._record(
+            name="Workbook schema/version shape",
+            passed=not errors,
+            details=f"schema={schema}, version={version}, items_type={type(items).__name__}",
         )
 
     def _check_workbook_metadata_shape(self, workbook_metadata: dict[str, Any]) -> None:
-        is_template = workbook_metadata.get("isTemplate") is True
-        template_data = workbook_metadata.get("templateData", {})
-        required_keys = {"version", "name", "description", "author", "source"}
-        missing = sorted(key for key in required_keys if key not in template_data)
-        self.results.append(
-            CheckResult(
-                name="Workbook metadata shape",
-                passed=is_template and not missing,
-                details="Workbook metadata valid" if is_template and not missing else f"Missing keys: {missing}",
-            )
+        errors = _schema_errors(_WORKBOOK_METADATA_VALIDATOR, workbook_metadata)
+        if "templateData" in _missing_required(errors):
+            missing = WORKBOOK_METADATA_SCHEMA["properties"]["templateData"]["required"]
+        else:
+            missing = _missing_required(errors, ("templateData",))
+        self._record(
+            name="Workbook metadata shape",
+            passed=not errors,
+            details="Workbook metadata valid" if not errors else f"Missing keys: {sorted(missing)}",
         )
 
     def _check_analytic_rule_shape(self, rule: dict[str, Any]) -> None:
-        required_fields = [
-            "id",
-            "name",
-            "description",
-            "severity",
-            "status",
-            "requiredDataConnectors",
-            "queryFrequency",
-            "queryPeriod",
-            "triggerOperator",
-            "triggerThreshold",
-            "tactics",
-            "relevantTechniques",
-            "query",
-            "kind",
-            "version",
-        ]
-        missing = [field for field in required_fields if field not in rule]
-        self.results.append(
-            CheckResult(
-                name="Analytics rule required field coverage",
-                passed=len(missing) == 0,
-                details="All required fields present" if not missing else f"Missing: {', '.join(missing)}",
-            )
+        errors = _schema_errors(_ANALYTIC_RULE_VALIDATOR, rule)
+        self._record(
+            name="Analytics rule required field coverage",
+            passed=not errors,
+            details="All required fields present" if not errors else f"Missing: {', '.join(_missing_required(errors))}",
         )
 
     def _check_release_notes_format(self, package: dict[str, Any]) -> None:
-        release_notes = self.release_notes_file.read_text(encoding="utf-8")
-        has_table_header = "| **Version** | **Date Modified (DD-MM-YYYY)** | **Change History** |" in release_notes
         target_version = package.get("metadata", {}).get("version", "")
-        mentions_current_version = target_version in release_notes
-        self.results.append(
-            CheckResult(
-                name="Release notes table format",
-                passed=has_table_header and mentions_current_version,
-                details=f"table_header={has_table_header}, includes_version({target_version})={mentions_current_version}",
-            )
+        has_table_header, mentions_current_version = _file_contains(
+            self.release_notes_file, RELEASE_NOTES_TABLE_HEADER, target_version.encode("utf-8")
+        )
+        self._record(
+            name="Release notes table format",
+            passed=has_table_header and mentions_current_version,
+            details=f"table_header={has_table_header}, includes_version({target_version})={mentions_current_version}",
         )
 
     def _write_report(self) -> Path:
         report_path = self.solution_root / "Verification" / "PrePublish_Validation_Report.md"
         generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-        passed = sum(1 for result in self.results if result.passed)
-        failed = len(self.results) - passed
-
-        lines = [
+        header = [
             "# Local Pre-Publish Validation Report",
             "",
             f"- Generated: {generated_at}",
             f"- Solution: {self.solution_root.name}",
-            f"- Summary: {passed} passed / {failed} failed",
+            f"- Summary: {self.passed_count} passed / {self.failed_count} failed",
             "",
             "## Checks",
             "",
@@ -239,12 +319,14 @@ class LocalPackageValidator:
             "|-------|--------|---------|",
         ]
 
-        for result in self.results:
-            status = "✅ PASS" if result.passed else "❌ FAIL"
-            details = result.details.replace("|", "\\|")
-            lines.append(f"| {result.name} | {status} | {details} |")
-
-        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        # Rows are streamed to the file rather than collected in a list first
+        with report_path.open("w", encoding="utf-8") as report:
+            report.writelines(f"{line}\n" for line in header)
+            report.writelines(
+                f"| {result.name} | {'✅ PASS' if result.passed else '❌ FAIL'} | "
+                f"{result.details.translate(_MARKDOWN_CELL_ESCAPES)} |\n"
+                for result in self.results
+            )
         return report_path
 
 
@@ -2,146 +2,195 @@
 """Analyze codebase for consistency patterns - Batch 6 analysis."""
 
 import ast
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
+from typing import List, Optional, Union
 
+# Below this many files process start-up costs more than the analysis itself
+PARALLEL_MIN_FILES = 64
 
-def analyze_type_hints(src_dir: str) -> dict:
-    """Analyze type hint coverage in Python files."""
-    results = {
-        "total_functions": 0,
-        "with_return_type": 0,
-        "with_all_param_types": 0,
-        "missing_hints": [],
-    }
 
-    for py_file in Path(src_dir).rglob("*.py"):
-        if "__pycache__" in str(py_file):
-            continue
-
-        try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-        except Exception:
-            continue
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                results["total_functions"] += 1
-
-                # Check return annotation
-                has_return = node.returns is not None
-                if has_return:
-                    results["with_return_type"] += 1
-
-                # Check parameter annotations (skip self/cls)
-                params = [
-                    arg for arg in node.args.args if arg.arg not in ("self", "cls")
-                ]
-                all_params_typed = (
-                    all(arg.annotation is not None for arg in params)
-                    if params
-                    else True
-                )
-                if all_params_typed:
-                    results["with_all_param_types"] += 1
+@dataclass
+class SourceFile:
+    """A Python source file read and parsed once for all analyses."""
 
-                if not has_return or not all_params_typed:
-                    rel_path = py_file.relative_to(Path(src_dir).parent)
-                    results["missing_hints"].append(
-                        f"{rel_path}:{node.lineno}:{node.name}"
-                    )
+    rel_path: Path
+    content: str
+    tree: Optional[ast.Module]
 
-    return results
 
+def find_python_files(src_dir: str) -> List[Path]:
+    """List the Python files under src_dir, excluding bytecode caches."""
+    return [
+        py_file
+        for py_file in Path(src_dir).rglob("*.py")
+        if "__pycache__" not in str(py_file)
+    ]
 
-def analyze_naming_conventions(src_dir: str) -> dict:
-    """Analyze naming convention compliance."""
-    results = {
-        "snake_case_functions": 0,
-        "camel_case_classes": 0,
-        "uppercase_constants": 0,
-        "violations": [],
-    }
 
-    snake_case_pattern = re.compile(r"^_*[a-z][a-z0-9_]*$")
-    camel_case_pattern = re.compile(r"^_*[A-Z][a-zA-Z0-9]*$")
+def load_source(py_file: Path, root: Path) -> Optional[SourceFile]:
+    """Read and parse one Python file.
 
-    for py_file in Path(src_dir).rglob("*.py"):
-        if "__pycache__" in str(py_file):
-            continue
+    Returns None if the file cannot be read; a file that fails to parse
+    keeps its content (for text scans) with ``tree`` set to None.
+    """
+    try:
+        with open(py_file, "r", encoding="utf-8") as f:
+            content = f.read()
+    except Exception:
+        return None
 
-        try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                tree = ast.parse(content)
-        except Exception:
-            continue
+    # Type comments are never inspected, so their tokenization is skipped
+    # explicitly; no AST optimization is requested because eliding
+    # ``if __debug__`` branches would drop functions from the counts
+    try:
+        tree: Optional[ast.Module] = ast.parse(
+            content, filename=str(py_file), type_comments=False
+        )
+    except Exception:
+        tree = None
+
+    return SourceFile(py_file.relative_to(root.parent), content, tree)
+
+
+def load_sources(src_dir: str) -> List[SourceFile]:
+    """Read and parse every Python file under src_dir."""
+    root = Path(src_dir)
+    sources = (load_source(py_file, root) for py_file in find_python_files(src_dir))
+    return [source for source in sources if source is not None]
+
+
+SNAKE_CASE_PATTERN = re.compile(r"^_*[a-z][a-z0-9_]*$")
+CAMEL_CASE_PATTERN = re.compile(r"^_*[A-Z][a-zA-Z0-9]*$")
+
+# Logger call sites are found in one scan; the argument checks are then
+# anchored at the opening parenthesis of each call.
+LOG_CALL_PATTERN = re.compile(r"logger\.(\w+)\s*\(")
+LOG_LEVELS = frozenset({"debug", "info", "warning", "error", "critical"})
+F_STRING_ARG_PATTERN = re.compile(r'f["\']')
+LAZY_ARG_PATTERN = re.compile(r'"[^"]*%[sd]')
+EXTRA_ARG_PATTERN = re.compile(r"[^)]*extra\s*=")
+
+
+class ConsistencyVisitor(ast.NodeVisitor):
+    """Collect type hint, naming and error handling stats in one traversal.
+
+    Only function, class and try nodes have handlers; every other node is
+    descended through by ``generic_visit`` without any isinstance checks.
+    """
+
+    def __init__(self) -> None:
+        self.rel_path = Path()
+        self.type_results: dict = {
+            "total_functions": 0,
+            "with_return_type": 0,
+            "with_all_param_types": 0,
+            "missing_hints": [],
+        }
+        self.naming_results: dict = {
+            "snake_case_functions": 0,
+            "camel_case_classes": 0,
+            "uppercase_constants": 0,
+            "violations": [],
+        }
+        self.error_results: dict = {
+            "total_try_blocks": 0,
+            "bare_excepts": 0,
+            "broad_exceptions": 0,
+            "specific_exceptions": 0,
+            "issues": [],
+        }
+
+    def visit_source(self, source: SourceFile) -> None:
+        """Visit a parsed source file, attributing findings to its path."""
+        if source.tree is None:
+            return
+
+        self.rel_path = source.rel_path
+        self.visit(source.tree)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._check_function(node)
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._check_function(node)
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        results = self.naming_results
+        if CAMEL_CASE_PATTERN.match(node.name):
+            results["camel_case_classes"] += 1
+        else:
+            results["violations"].append(
+                f"{self.rel_path}:{node.lineno}: Class '{node.name}' not CamelCase"
+            )
+        self.generic_visit(node)
+
+    def visit_Try(self, node: ast.Try) -> None:
+        results = self.error_results
+        results["total_try_blocks"] += 1
+
+        for handler in node.handlers:
+            if handler.type is None:
+                results["bare_excepts"] += 1
+                results["issues"].append(
+                    f"{self.rel_path}:{handler.lineno}: Bare except clause"
+                )
+            elif isinstance(handler.type, ast.Name):
+                if handler.type.id == "Exception":
+                    results["broad_exceptions"] += 1
+                else:
+                    results["specific_exceptions"] += 1
 
-        rel_path = py_file.relative_to(Path(src_dir).parent)
+        self.generic_visit(node)
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if snake_case_pattern.match(node.name):
-                    results["snake_case_functions"] += 1
-                else:
-                    results["violations"].append(
-                        f"{rel_path}:{node.lineno}: Function '{node.name}' not snake_case"
-                    )
+    def _check_function(
+        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> None:
+        results = self.type_results
+        results["total_functions"] += 1
 
-            elif isinstance(node, ast.ClassDef):
-                if camel_case_pattern.match(node.name):
-                    results["camel_case_classes"] += 1
-                else:
-                    results["violations"].append(
-                        f"{rel_path}:{node.lineno}: Class '{node.name}' not CamelCase"
-                    )
+        # Check return annotation
+        has_return = node.returns is not None
+        if has_return:
+            results["with_return_type"] += 1
 
-    return results
+        # Check parameter annotations (skip self/cls)
+        params = [arg for arg in node.args.args if arg.arg not in ("self", "cls")]
+        all_params_typed = (
+            all(arg.annotation is not None for arg in params) if params else True
+        )
+        if all_params_typed:
+            results["with_all_param_types"] += 1
 
+        if not has_return or not all_params_typed:
+            results["missing_hints"].append(
+                f"{self.rel_path}:{node.lineno}:{node.name}"
+            )
 
-def analyze_error_handling(src_dir: str) -> dict:
-    """Analyze error handling patterns."""
-    results = {
-        "total_try_blocks": 0,
-        "bare_excepts": 0,
-        "broad_exceptions": 0,
-        "specific_exceptions": 0,
-        "issues": [],
-    }
+        # Naming conventions
+        if SNAKE_CASE_PATTERN.match(node.name):
+            self.naming_results["snake_case_functions"] += 1
+        else:
+            self.naming_results["violations"].append(
+                f"{self.rel_path}:{node.lineno}: Function '{node.name}' not snake_case"
+            )
 
-    for py_file in Path(src_dir).rglob("*.py"):
-        if "__pycache__" in str(py_file):
-            continue
-
-        try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-        except Exception:
-            continue
-
-        rel_path = py_file.relative_to(Path(src_dir).parent)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Try):
-                results["total_try_blocks"] += 1
-
-                for handler in node.handlers:
-                    if handler.type is None:
-                        results["bare_excepts"] += 1
-                        results["issues"].append(
-                            f"{rel_path}:{handler.lineno}: Bare except clause"
-                        )
-                    elif isinstance(handler.type, ast.Name):
-                        if handler.type.id == "Exception":
-                            results["broad_exceptions"] += 1
-                        else:
-                            results["specific_exceptions"] += 1
 
-    return results
+def analyze_syntax_trees(sources: List[SourceFile]) -> ConsistencyVisitor:
+    """Analyze type hints, naming conventions and error handling together."""
+    visitor = ConsistencyVisitor()
+    for source in sources:
+        visitor.visit_source(source)
+    return visitor
 
 
-def analyze_logging(src_dir: str) -> dict:
+def analyze_logging(sources: List[SourceFile]) -> dict:
     """Analyze logging patterns."""
     results = {
         "total_log_calls": 0,
@@ -151,40 +200,103 @@ def analyze_logging(src_dir: str) -> dict:
         "issues": [],
     }
 
-    for py_file in Path(src_dir).rglob("*.py"):
-        if "__pycache__" in str(py_file):
-            continue
+    for source in sources:
+        content = source.content
 
-        try:
-            with open(py_file, "r", encoding="utf-8") as f:
-                content = f.read()
-        except Exception:
-            continue
+        for call in LOG_CALL_PATTERN.finditer(content):
+            args_start = call.end()
 
-        # Count logger calls
-        log_patterns = re.findall(
-            r"logger\.(debug|info|warning|error|critical)\s*\(", content
-        )
-        results["total_log_calls"] += len(log_patterns)
+            # Count logger calls
+            if call.group(1) in LOG_LEVELS:
+                results["total_log_calls"] += 1
 
-        # Check for f-string logging (performance issue)
-        f_string_logs = re.findall(r'logger\.\w+\s*\(f["\']', content)
-        results["f_string_logs"] += len(f_string_logs)
+            # Check for f-string logging (performance issue)
+            if F_STRING_ARG_PATTERN.match(content, args_start):
+                results["f_string_logs"] += 1
 
-        # Check for lazy logging with %
-        lazy_logs = re.findall(r'logger\.\w+\s*\("[^"]*%[sd]', content)
-        results["lazy_logs"] += len(lazy_logs)
+            # Check for lazy logging with %
+            elif LAZY_ARG_PATTERN.match(content, args_start):
+                results["lazy_logs"] += 1
 
-        # Check for structured logging (extra=)
-        structured = re.findall(r"logger\.\w+\s*\([^)]*extra\s*=", content)
-        results["structured_logs"] += len(structured)
+            # Check for structured logging (extra=)
+            if EXTRA_ARG_PATTERN.match(content, args_start):
+                results["structured_logs"] += 1
 
     return results
 
 
+@dataclass
+class SourceAnalysis:
+    """Results of every analysis over one or more source files."""
+
+    type_results: dict
+    naming_results: dict
+    error_results: dict
+    log_results: dict
+
+    def merge(self, other: "SourceAnalysis") -> None:
+        """Add another analysis: counters are summed and lists extended."""
+        for results, other_results in (
+            (self.type_results, other.type_results),
+            (self.naming_results, other.naming_results),
+            (self.error_results, other.error_results),
+            (self.log_results, other.log_results),
+        ):
+            for key, value in other_results.items():
+                if isinstance(value, list):
+                    results[key].extend(value)
+                else:
+                    results[key] += value
+
+
+def analyze_sources(sources: List[SourceFile]) -> SourceAnalysis:
+    """Run every analysis over already loaded sources."""
+    # Type hints, naming and error handling share one AST traversal
+    visitor = analyze_syntax_trees(sources)
+    return SourceAnalysis(
+        type_results=visitor.type_results,
+        naming_results=visitor.naming_results,
+        error_results=visitor.error_results,
+        log_results=analyze_logging(sources),
+    )
+
+
+def analyze_file(py_file: Path, root: Path) -> SourceAnalysis:
+    """Load and analyze a single file (process pool worker)."""
+    source = load_source(py_file, root)
+    return analyze_sources([source] if source is not None else [])
+
+
+def analyze_directory(src_dir: str) -> SourceAnalysis:
+    """Analyze every Python file under src_dir, in parallel for large trees.
+
+    Workers return plain per-file results rather than ASTs, so little
+    crosses the process boundary; results are merged in file order.
+    """
+    py_files = find_python_files(src_dir)
+    root = Path(src_dir)
+
+    if len(py_files) < PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+        sources = (load_source(py_file, root) for py_file in py_files)
+        return analyze_sources([source for source in sources if source is not None])
+
+    analysis = analyze_sources([])
+    with ProcessPoolExecutor() as executor:
+        for file_analysis in executor.map(
+            analyze_file, py_files, repeat(root), chunksize=16
+        ):
+            analysis.merge(file_analysis)
+    return analysis
+
+
 def main():
     """Run all consistency analyses."""
     src_dir = "src"
+    analysis = analyze_directory(src_dir)
+    type_results = analysis.type_results
+    naming_results = analysis.naming_results
+    error_results = analysis.error_results
+    log_results = analysis.log_results
 
     print("=" * 60)
     print("BATCH 6: CONSISTENCY & STANDARDS ANALYSIS")
@@ -192,7 +304,6 @@ def main():
 
     # Type hints analysis
     print("\n## Type Hints Analysis")
-    type_results = analyze_type_hints(src_dir)
     print(f"Total functions: {type_results['total_functions']}")
     print(
         f"With return type: {type_results['with_return_type']} "
@@ -206,7 +317,6 @@ def main():
 
     # Naming conventions
     print("\n## Naming Conventions Analysis")
-    naming_results = analyze_naming_conventions(src_dir)
     print(f"Snake case functions: {naming_results['snake_case_functions']}")
     print(f"CamelCase classes: {naming_results['camel_case_classes']}")
     print(f"Naming violations: {len(naming_results['violations'])}")
@@ -216,7 +326,6 @@ def main():
 
     # Error handling
     print("\n## Error Handling Analysis")
-    error_results = analyze_error_handling(src_dir)
     print(f"Total try blocks: {error_results['total_try_blocks']}")
     print(f"Bare excepts: {error_results['bare_excepts']}")
     print(f"Broad Exception catches: {error_results['broad_exceptions']}")
@@ -228,7 +337,6 @@ def main():
 
     # Logging
     print("\n## Logging Analysis")
-    log_results = analyze_logging(src_dir)
     print(f"Total log calls: {log_results['total_log_calls']}")
     print(f"F-string logs (eager eval): {log_results['f_string_logs']}")
     print(f"Lazy logs (% formatting): {log_results['lazy_logs']}")
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+# Unlinks are metadata-journal bound and release the GIL, so they overlap well
+DELETE_WORKERS = 32
+
 
 @dataclass
 class CleanupSummary:
@@ -26,31 +31,46 @@ def cleanup_failed_batches(
     root = Path(directory)
     root.mkdir(parents=True, exist_ok=True)
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    # Compare raw st_mtime floats; no datetime is built per file
+    cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).timestamp()
     files_examined = 0
-    files_deleted = 0
+    expired: list[str] = []
     bytes_reclaimed = 0
 
-    for json_file in sorted(root.glob("*.json")):
-        files_examined += 1
-        modified = datetime.fromtimestamp(json_file.stat().st_mtime, tz=timezone.utc)
-        if modified >= cutoff:
-            continue
+    # scandir yields names without a stat call; each candidate is stat'd once
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+
+            files_examined += 1
+            stat_result = entry.stat()
+            if stat_result.st_mtime >= cutoff_ts:
+                continue
 
-        size = json_file.stat().st_size
-        if not dry_run:
-            json_file.unlink(missing_ok=True)
+            expired.append(entry.path)
+            bytes_reclaimed += stat_result.st_size
 
-        files_deleted += 1
-        bytes_reclaimed += size
+    if expired and not dry_run:
+        with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(expired))) as pool:
+            for _ in pool.map(_unlink_missing_ok, expired):
+                pass
 
     return CleanupSummary(
         files_examined=files_examined,
-        files_deleted=files_deleted,
+        files_deleted=len(expired),
         bytes_reclaimed=bytes_reclaimed,
     )
 
 
+def _unlink_missing_ok(path: str) -> None:
+    """Remove a file, ignoring one that has already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build cleanup CLI parser."""
     parser = argparse.ArgumentParser(
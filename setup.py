@@ -1,10 +1,12 @@
 # setup.py
 
-import os
+from pathlib import Path
 from typing import List
 
 from setuptools import find_packages, setup
 
+ROOT = Path(__file__).resolve().parent
+
 
 def read_requirements(filename: str) -> List[str]:
     """Read requirements from a top-level requirements file.
@@ -13,18 +15,13 @@ def read_requirements(filename: str) -> List[str]:
     places `requirements.txt` and `requirements-dev.txt` at the repository
     root — read those files directly to avoid FileNotFoundError.
     """
-    path = os.path.join(os.path.dirname(__file__), filename)
-    if not os.path.exists(path):
+    path = ROOT / filename
+    if not path.is_file():
         # Fallback to top-level file name if called with a path fragment
-        path = os.path.join(os.path.dirname(__file__), os.pardir, filename)
-        path = os.path.normpath(path)
+        path = ROOT.parent / filename
 
-    with open(path, "r", encoding="utf-8") as f:
-        return [
-            line.strip()
-            for line in f
-            if line.strip() and not line.strip().startswith("#")
-        ]
+    with path.open(encoding="utf-8") as f:
+        return [line for line in map(str.strip, f) if line and not line.startswith("#")]
 
 
 setup(
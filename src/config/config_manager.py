@@ -1,22 +1,133 @@
 # src/config/config_manager.py
 """Configuration loading, validation, and runtime update management."""
 
+import asyncio
+import copy
+import hashlib
+import json
 import logging
 import os
+import re
+import sys
 import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Mapping, Optional
 
 import yaml
-from azure.identity.aio import DefaultAzureCredential
-from azure.keyvault.secrets.aio import SecretClient
-from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
 
+# The Azure SDKs add ~300 ms of imports, so they load on first Key Vault use
+# (see _load_keyvault_sdk); the names stay here so tests can patch them
+DefaultAzureCredential: Any = None
+SecretClient: Any = None
 
-@dataclass
+try:  # libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze_config(value: Any) -> Any:
+    """Read-only copy of a parsed config value, all the way down
+
+    Dicts are copied into MappingProxyType views and lists into tuples, so
+    the published snapshot shares no mutable state with the config cache.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {key: _freeze_config(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze_config(item) for item in value)
+    return value
+
+
+# Components and fields that must be present after merging and env overrides
+_REQUIRED_COMPONENTS: tuple[str, ...] = ("aws", "sentinel")
+_AWS_REQUIRED: tuple[str, ...] = ("region", "bucket_name")
+_SENTINEL_REQUIRED: tuple[str, ...] = ("workspace_id", "dcr_endpoint", "rule_id")
+
+# Key Vault secrets the validators fall back to when a field is left empty
+_DEFAULT_VAULT_SECRETS: Dict[tuple, str] = {
+    ("aws", "access_key_id"): "aws-access-key-id",
+    ("aws", "secret_access_key"): "aws-secret-access-key",
+    ("sentinel", "dcr_endpoint"): "sentinel-dcr-endpoint",
+    ("sentinel", "rule_id"): "sentinel-rule-id",
+}
+
+
+def _load_keyvault_sdk() -> tuple[Any, Any]:
+    """Import the async Key Vault credential and client classes on first use"""
+    global DefaultAzureCredential, SecretClient
+    if DefaultAzureCredential is None:
+        from azure.identity.aio import DefaultAzureCredential
+    if SecretClient is None:
+        from azure.keyvault.secrets.aio import SecretClient
+    return DefaultAzureCredential, SecretClient
+
+
+@lru_cache(maxsize=256)
+def _secret_env_name(secret_name: str) -> str:
+    """Environment variable consulted for a Key Vault secret (aws-key -> AWS_KEY)"""
+    return secret_name.upper().replace("-", "_")
+
+
+# dataclass(slots=True) only exists on Python 3.10+
+_DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+# JSON numbers that YAML 1.1 also reads as floats: a fraction is required
+# and an exponent needs an explicit sign ("1e5" and "1.5e5" are strings)
+_YAML_FLOAT_NUMBER = re.compile(r"-?[0-9]+\.[0-9]+(?:[eE][-+][0-9]+)?")
+
+
+def _yaml_compatible_float(text: str) -> float:
+    """json parse_float hook that rejects numbers YAML would not read as floats"""
+    if _YAML_FLOAT_NUMBER.fullmatch(text) is None:
+        raise ValueError(f"{text} is not a YAML float")
+    return float(text)
+
+
+def _reject_json_constant(name: str) -> Any:
+    """json parse_constant hook: YAML reads NaN and Infinity as strings"""
+    raise ValueError(f"{name} is not a YAML constant")
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on its stat signature.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key: an edited file
+    gets a new signature and is reparsed, while spurious watcher events on an
+    unchanged file are served from the cache.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    # JSON is a YAML subset that the json module parses ~20x faster; flow-style
+    # YAML that merely starts with a bracket fails here and takes the YAML path,
+    # as do numbers and constants the YAML loader would read differently
+    if data.lstrip()[:1] in (b"{", b"["):
+        try:
+            return json.loads(
+                data,
+                parse_float=_yaml_compatible_float,
+                parse_constant=_reject_json_constant,
+            )
+        except ValueError:
+            pass
+    return yaml.load(data, Loader=_YamlLoader)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DatabaseConfig:
     """Database connection configuration.
 
@@ -44,7 +155,7 @@ class DatabaseConfig:
     max_connections: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AwsConfig:
     """AWS S3 configuration for log ingestion.
 
@@ -70,7 +181,7 @@ class AwsConfig:
     max_retries: int = 3
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SentinelConfig:
     """Azure Sentinel configuration for log ingestion.
 
@@ -96,7 +207,7 @@ class SentinelConfig:
     retention_days: int = 90
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class MonitoringConfig:
     """Monitoring and alerting configuration.
 
@@ -129,6 +240,26 @@ class ConfigurationError(Exception):
 class ConfigManager:
     """Centralized configuration manager with env override and hot-reload support."""
 
+    _yaml_loader_reported: ClassVar[bool] = False
+
+    # Hot-reload poller: seconds between stat checks, and how long a changed
+    # file must stay unchanged before reloading (coalesces editor save bursts)
+    CONFIG_POLL_INTERVAL: ClassVar[float] = 2.0
+    RELOAD_DEBOUNCE: ClassVar[float] = 0.5
+
+    # Seconds a fetched Key Vault secret is reused before get_secret refetches
+    SECRET_CACHE_TTL: ClassVar[float] = 300.0
+
+    # Minimum seconds between repeats of the same secret-resolution warning
+    WARNING_INTERVAL: ClassVar[float] = 60.0
+
+    # Upper bound on Key Vault requests in flight for one batch lookup
+    MAX_CONCURRENT_SECRET_FETCHES: ClassVar[int] = 8
+
+    # Seconds a validated configuration is reused for byte-identical reloads;
+    # bounds how long rotated env-var secrets can go unnoticed
+    VALIDATION_TTL: ClassVar[float] = 300.0
+
     def __init__(
         self,
         config_path: str,
@@ -154,9 +285,15 @@ class ConfigManager:
 
         # Initialize internal state
         self._config_cache = {}
+        # Serializes reload_config writers only; readers never take it and see
+        # whichever immutable snapshot was last published to self._snapshot
         self._config_lock = threading.Lock()
         self._last_reload = time.time()
         self._env_key_path_cache: Dict[str, list[str]] = {}
+        self._secret_cache: Dict[str, tuple[float, str]] = {}
+        self._typed_config_cache: Dict[str, tuple] = {}
+        self._last_good: Optional[tuple[bytes, float]] = None
+        self._warned_at: Dict[str, float] = {}
 
         # Set up logging
         self._setup_logging()
@@ -166,7 +303,7 @@ class ConfigManager:
 
         # Phase 4 (B2-008): Secrets client initialization deferred to async factory method
         # Do NOT call _init_secrets_client() here (it's now async)
-        self.secret_client: Optional[SecretClient] = None
+        self.secret_client: Optional[Any] = None
 
         # Start configuration file watcher if hot reload is enabled
         if enable_hot_reload:
@@ -212,17 +349,23 @@ class ConfigManager:
         instance._config_lock = threading.Lock()
         instance._last_reload = time.time()
         instance._env_key_path_cache = {}
+        instance._secret_cache = {}
+        instance._typed_config_cache = {}
+        instance._last_good = None
+        instance._warned_at = {}
 
         # Set up logging
         instance._setup_logging()
 
-        # Load initial configuration
-        instance.reload_config()
-
-        # Initialize async secrets client if vault URL provided
+        # Initialize async secrets client if vault URL provided, and fetch the
+        # secrets the configuration references before it is first validated
         instance.secret_client = None
         if vault_url:
             await instance._init_secrets_client()
+            await instance._prefetch_secrets()
+
+        # Load initial configuration
+        instance.reload_config()
 
         # Start configuration file watcher if hot reload is enabled
         if enable_hot_reload:
@@ -232,12 +375,19 @@ class ConfigManager:
 
     def _setup_logging(self) -> None:
         """Configure logging for configuration management"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        # basicConfig is a no-op once the root logger has handlers, but it still
+        # takes the logging module lock; skip it for every later instance
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            )
         self.logger = logging.getLogger("ConfigManager")
 
+        if not ConfigManager._yaml_loader_reported:
+            ConfigManager._yaml_loader_reported = True
+            self.logger.info("Using %s for YAML parsing", _YamlLoader.__name__)
+
     async def _init_secrets_client(self) -> None:
         """
         Initialize Azure Key Vault async client
@@ -247,60 +397,186 @@ class ConfigManager:
         """
         if self.vault_url:
             try:
-                credential = DefaultAzureCredential()
-                self.secret_client = SecretClient(
+                credential_cls, client_cls = _load_keyvault_sdk()
+                credential = credential_cls()
+                self.secret_client = client_cls(
                     vault_url=self.vault_url, credential=credential
                 )
                 self.logger.info(
                     "Successfully initialized Azure Key Vault async client"
                 )
             except Exception as e:
-                self.logger.error(f"Failed to initialize Key Vault client: {e!s}")
+                self.logger.error("Failed to initialize Key Vault client: %s", e)
                 raise ConfigurationError(
                     "Failed to initialize secrets management"
                 ) from e
 
+    async def _prefetch_secrets(self) -> None:
+        """Fetch all Key Vault secrets referenced by the configuration concurrently
+
+        Round-trips overlap, so startup pays one Key Vault latency rather than
+        one per secret. Failed fetches are left to the sync resolver's
+        environment fallback.
+        """
+        config = self._merge_configs(
+            self._load_yaml_config("base"),
+            self._load_yaml_config(self.environment),
+        )
+        # APP_ overrides may point credential fields at keyvault: references too
+        self._apply_env_variables(config)
+
+        needed = set()
+        for (component, field), secret_name in _DEFAULT_VAULT_SECRETS.items():
+            if not config.get(component, {}).get(field):
+                needed.add(secret_name)
+        for section in config.values():
+            if isinstance(section, dict):
+                for value in section.values():
+                    if isinstance(value, str) and value.startswith("keyvault:"):
+                        needed.add(value.split(":", 1)[1])
+
+        # get_secret fills the cache; failures are returned, not raised
+        await self._gather_secrets(sorted(needed), return_exceptions=True)
+
+    async def _gather_secrets(
+        self, secret_names: List[str], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Run get_secret for each name concurrently, bounded by the fetch limit"""
+        limit = asyncio.Semaphore(self.MAX_CONCURRENT_SECRET_FETCHES)
+
+        async def fetch(secret_name: str) -> str:
+            async with limit:
+                return await self.get_secret(secret_name)
+
+        return await asyncio.gather(
+            *(fetch(name) for name in secret_names),
+            return_exceptions=return_exceptions,
+        )
+
     def _start_config_watcher(self) -> None:
-        """Start watching configuration files for changes"""
+        """Start polling the base and environment config files for changes"""
+        watched = (
+            self.config_path / "base.yaml",
+            self.config_path / f"{self.environment}.yaml",
+        )
+        signature = self._config_signature(watched)
+        if not any(signature):
+            # Env-only configuration: no file can change, so no thread to run
+            self.logger.info(
+                "No configuration files in %s; hot reload disabled", self.config_path
+            )
+            return
+
+        self._watcher_stop = threading.Event()
+        self._watcher_thread = threading.Thread(
+            target=self._watch_config_files,
+            args=(
+                watched,
+                signature,
+                self._config_digest(watched),
+            ),
+            name="config-watcher",
+            daemon=True,
+        )
+        self._watcher_thread.start()
+        self.logger.info("Started configuration file watcher")
 
-        class ConfigFileHandler(FileSystemEventHandler):
-            def __init__(self, config_manager):
-                self.config_manager = config_manager
+    def stop_config_watcher(self) -> None:
+        """Stop the hot-reload poller, if one is running"""
+        stop = getattr(self, "_watcher_stop", None)
+        if stop is not None:
+            stop.set()
+            self._watcher_thread.join()
+
+    @staticmethod
+    def _config_signature(paths: tuple) -> tuple:
+        """Return (mtime_ns, size) for each path, or None if it is missing"""
+        signature = []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    @staticmethod
+    def _config_digest(paths: tuple) -> bytes:
+        """Hash the contents of the watched files (missing files hash as empty)"""
+        digest = hashlib.blake2b(digest_size=16)
+        for path in paths:
+            try:
+                digest.update(path.read_bytes())
+            except FileNotFoundError:
+                pass
+            digest.update(b"\0")
+        return digest.digest()
+
+    def _watch_config_files(
+        self, paths: tuple, last: tuple, last_digest: bytes
+    ) -> None:
+        """Poller loop: reload once a changed file set has settled"""
+        stop = self._watcher_stop
+        while not stop.wait(self.CONFIG_POLL_INTERVAL):
+            current = self._config_signature(paths)
+            if current == last:
+                continue
+
+            while not stop.wait(self.RELOAD_DEBOUNCE):
+                settled = self._config_signature(paths)
+                if settled == current:
+                    break
+                current = settled
+            else:
+                return
 
-            def on_modified(self, event):
-                if event.src_path.endswith(".yaml") or event.src_path.endswith(".yml"):
-                    self.config_manager.reload_config()
+            last = current
 
-        observer = Observer()
-        observer.schedule(ConfigFileHandler(self), self.config_path, recursive=False)
-        observer.start()
-        self.logger.info("Started configuration file watcher")
+            # Touches and editor rewrites bump mtime without changing content
+            digest = self._config_digest(paths)
+            if digest == last_digest:
+                continue
+            last_digest = digest
+
+            try:
+                self.reload_config(reuse_validated=True)
+            except ConfigurationError:
+                # Already logged; keep serving the previous configuration
+                pass
 
-    def get_config(self, component: str) -> Dict[str, Any]:
+    def get_config(self, component: str) -> Mapping[str, Any]:
         """
         Get configuration for a specific component
 
+        Reads are lock-free: reload_config() publishes a new read-only
+        snapshot with a single attribute rebind.
+
         Args:
             component: Component name (e.g., 'aws', 'sentinel', 'monitoring')
 
         Returns:
-            Dictionary containing component configuration
+            Read-only mapping containing component configuration. Nested
+            mappings are read-only too and lists are tuples. The views cannot
+            be pickled, deep-copied or passed to json.dumps directly; copy
+            them into plain dicts first.
         """
-        component_config = self._config_cache.get(component)
-        if component_config is not None:
-            return component_config
+        return self._snapshot.get(component, _EMPTY_CONFIG)
 
-        with self._config_lock:
-            component_config = self._config_cache.get(component)
-            if component_config is None:
-                self.reload_config()
-                component_config = self._config_cache.get(component, {})
+    def reload_config(self, reuse_validated: bool = False) -> None:
+        """Reload configuration from files and environment
 
-            return component_config
+        Concurrent reloads are serialized; get_config() readers are not blocked
+        and switch to the new snapshot only once it has been validated.
 
-    def reload_config(self) -> None:
-        """Reload configuration from files and environment"""
+        Args:
+            reuse_validated: Keep the last validated snapshot when the merged
+                config is unchanged and VALIDATION_TTL has not lapsed. Only the
+                file watcher sets this; explicit reloads always re-resolve
+                secret references so rotated env/Key Vault values are picked up.
+        """
         with self._config_lock:
+            previous = self._config_cache
             try:
                 # Load base configuration
                 base_config = self._load_yaml_config("base")
@@ -314,26 +590,63 @@ class ConfigManager:
                 # Apply environment variables
                 self._apply_env_variables()
 
+                # Watcher reload with the same inputs as the last good one: keep
+                # its validated result and skip validation and secret resolution
+                # until the TTL lapses
+                fingerprint = hashlib.blake2b(
+                    repr(self._config_cache).encode(), digest_size=16
+                ).digest()
+                last_good = self._last_good
+                if (
+                    reuse_validated
+                    and last_good is not None
+                    and last_good[0] == fingerprint
+                    and time.monotonic() - last_good[1] < self.VALIDATION_TTL
+                ):
+                    self._config_cache = previous
+                    self._last_reload = time.time()
+                    self.logger.debug("Configuration unchanged; skipped revalidation")
+                    return
+
                 # Validate configuration
                 self._validate_config()
 
+                # Publish a read-only copy for lock-free readers. Component
+                # names are interned so get_config("aws")-style literal lookups
+                # match by identity instead of comparing parsed YAML strings.
+                self._snapshot = MappingProxyType(
+                    {
+                        (
+                            sys.intern(name) if isinstance(name, str) else name
+                        ): _freeze_config(value)
+                        for name, value in self._config_cache.items()
+                    }
+                )
+
+                self._last_good = (fingerprint, time.monotonic())
                 self._last_reload = time.time()
                 self.logger.info("Successfully reloaded configuration")
 
             except Exception as e:
-                self.logger.error(f"Failed to reload configuration: {e!s}")
+                # Never leave a half-applied, unvalidated config behind
+                self._config_cache = previous
+                self._last_good = None
+                self.logger.error("Failed to reload configuration: %s", e)
                 raise ConfigurationError(f"Configuration reload failed: {e!s}") from e
 
     def _load_yaml_config(self, config_name: str) -> Dict[str, Any]:
         """Load YAML configuration file"""
         config_file = self.config_path / f"{config_name}.yaml"
         try:
-            if config_file.exists():
-                with open(config_file, "r") as f:
-                    return yaml.safe_load(f)
-            return {}
+            try:
+                stat = config_file.stat()
+            except FileNotFoundError:
+                return {}
+            parsed = _parse_yaml_file(str(config_file), stat.st_mtime_ns, stat.st_size)
+            # Callers merge and mutate the result; keep the cached parse pristine
+            return copy.deepcopy(parsed)
         except Exception as e:
-            self.logger.error(f"Failed to load {config_name} configuration: {e!s}")
+            self.logger.error("Failed to load %s configuration: %s", config_name, e)
             raise ConfigurationError(
                 f"Failed to load {config_name} configuration"
             ) from e
@@ -341,24 +654,39 @@ class ConfigManager:
     def _merge_configs(
         self, base: Dict[str, Any], override: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Merge configuration dictionaries with override"""
-        merged = base.copy()
-        for key, value in override.items():
-            if isinstance(value, dict) and key in merged:
-                merged[key] = self._merge_configs(merged[key], value)
-            else:
-                merged[key] = value
-        return merged
-
-    def _apply_env_variables(self) -> None:
-        """Apply environment variable overrides"""
-        for key, value in os.environ.items():
-            if key.startswith("APP_"):
-                config_path = self._env_key_path_cache.get(key)
-                if config_path is None:
-                    config_path = self._parse_env_override_path(key[4:])
-                    self._env_key_path_cache[key] = config_path
-                self._set_nested_value(self._config_cache, config_path, value)
+        """Merge override into base in place and return base
+
+        ``base`` must be a private copy (``_load_yaml_config`` returns one), so
+        the merge walks an explicit stack instead of copying every level.
+        """
+        # No dict.update fast path for flat levels: the any(isinstance(...))
+        # scan needed to detect them measured slower than this loop
+        stack = [(base, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+        return base
+
+    def _apply_env_variables(self, config: Optional[Dict[str, Any]] = None) -> None:
+        """Apply environment variable overrides (to the working config by default)"""
+        if config is None:
+            config = self._config_cache
+        # Iterating keys only decodes names; values are fetched for matches alone
+        app_keys = [key for key in os.environ if key.startswith("APP_")]
+        for key in app_keys:
+            value = os.environ.get(key)
+            if value is None:
+                continue
+            config_path = self._env_key_path_cache.get(key)
+            if config_path is None:
+                config_path = self._parse_env_override_path(key[4:])
+                self._env_key_path_cache[key] = config_path
+            self._set_nested_value(config, config_path, value)
 
     def _parse_env_override_path(self, env_key: str) -> list[str]:
         """Parse APP_ environment variable key into config path.
@@ -383,6 +711,8 @@ class ConfigManager:
 
     def _set_nested_value(self, config: Dict[str, Any], path: list, value: Any) -> None:
         """Set nested dictionary value using path list"""
+        # A plain loop: functools.reduce with a setdefault lambda measured ~2x
+        # slower for the 2-3 element paths env overrides produce
         current = config
         for part in path[:-1]:
             current = current.setdefault(part, {})
@@ -390,8 +720,7 @@ class ConfigManager:
 
     def _validate_config(self) -> None:
         """Validate configuration completeness and types"""
-        required_components = ["aws", "sentinel"]
-        for component in required_components:
+        for component in _REQUIRED_COMPONENTS:
             if component not in self._config_cache:
                 raise ConfigurationError(f"Missing configuration for {component}")
 
@@ -437,8 +766,7 @@ class ConfigManager:
                 config["secret_access_key"]
             )
 
-        required_fields = ["region", "bucket_name"]
-        for field in required_fields:
+        for field in _AWS_REQUIRED:
             if not config.get(field):
                 raise ConfigurationError(f"Missing required AWS configuration: {field}")
 
@@ -468,8 +796,7 @@ class ConfigManager:
         if not config.get("table_name"):
             config["table_name"] = "Custom_Test_CL"
 
-        required_fields = ["workspace_id", "dcr_endpoint", "rule_id"]
-        for field in required_fields:
+        for field in _SENTINEL_REQUIRED:
             if not config.get(field):
                 raise ConfigurationError(
                     f"Missing required Sentinel configuration: {field}"
@@ -485,83 +812,99 @@ class ConfigManager:
         Returns:
             Resolved secret value
         """
-        if not isinstance(value, str):
+        # Plain values (region, table names, ...) are the common case: one
+        # membership test, then one dict lookup on the prefix for the rest
+        if not isinstance(value, str) or ":" not in value:
             return value
 
-        # Support keyvault:secret-name pattern
-        if value.startswith("keyvault:"):
-            secret_name = value.split(":", 1)[1]
-            try:
-                if self.vault_url and self.secret_client:
-                    # Phase 4 (B2-008): Sync method cannot await async client
-                    # Fall back to environment variable (sync operations should use env vars)
-                    # For async secret resolution, use get_secret() directly
-                    self.logger.warning(
-                        f"Sync method cannot resolve Key Vault secret '{secret_name}' directly. "
-                        "Falling back to environment variable. "
-                        "Use ConfigManager.get_secret() for async Key Vault access."
-                    )
-                    env_fallback = os.environ.get(
-                        secret_name.upper().replace("-", "_"), ""
-                    )
-
-                    # In production, fail loudly if Key Vault was expected but sync context
-                    if self.environment == "prod" and not env_fallback:
-                        raise ConfigurationError(
-                            f"Production environment requires Key Vault for secret '{secret_name}', "
-                            f"but _resolve_secret_reference() is a sync method. "
-                            f"Set env var {secret_name.upper().replace('-', '_')} or use get_secret() async method."
-                        )
-
-                    return env_fallback
-                else:
-                    self.logger.warning(
-                        f"Key Vault not configured, cannot resolve '{secret_name}'"
-                    )
-                    # Fall back to environment variable with same name
-                    env_fallback = os.environ.get(
-                        secret_name.upper().replace("-", "_"), ""
-                    )
-
-                    # In production, fail loudly if Key Vault was expected but unavailable
-                    if self.environment == "prod" and not env_fallback:
-                        raise ConfigurationError(
-                            f"Production environment requires Key Vault for secret '{secret_name}'. "
-                            f"Key Vault URL: {self.vault_url or 'not configured'}. "
-                            "Environment fallback not allowed in production."
-                        )
-
-                    return env_fallback
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to resolve secret '{secret_name}' from Key Vault: {e}"
-                )
-                env_fallback = os.environ.get(secret_name.upper().replace("-", "_"), "")
-
-                # In production, fail loudly instead of falling back
-                if self.environment == "prod":
-                    raise ConfigurationError(
-                        f"Production environment cannot fallback to env vars for secret '{secret_name}'. "
-                        f"Key Vault must be accessible. Error: {e}"
-                    ) from e
-
-                return env_fallback
+        prefix, _, reference = value.partition(":")
+        resolver = self._REFERENCE_RESOLVERS.get(prefix)
+        if resolver is None:
+            return value
+        return resolver(self, reference)
+
+    def _resolve_keyvault_reference(self, secret_name: str) -> str:
+        """Resolve a 'keyvault:secret-name' reference"""
+        # The sync path cannot refetch, so an expired vault value still
+        # beats the environment fallback; get_secret() refreshes it
+        cached = self._secret_cache.get(secret_name)
+        if cached is not None:
+            return cached[1]
+        # Nothing below can fail except the deliberate production check, so
+        # decide with plain predicates rather than raising through try/except
+        env_name = _secret_env_name(secret_name)
+        env_fallback = os.environ.get(env_name, "")
+        client_ready = bool(self.vault_url and self.secret_client)
+
+        if client_ready:
+            # Phase 4 (B2-008): Sync method cannot await async client
+            # Fall back to environment variable (sync operations should use env vars)
+            # For async secret resolution, use get_secret() directly
+            self._warn_throttled(
+                f"sync-keyvault:{secret_name}",
+                "Sync method cannot resolve Key Vault secret '%s' directly. "
+                "Falling back to environment variable. "
+                "Use ConfigManager.get_secret() for async Key Vault access.",
+                secret_name,
+            )
+        else:
+            self._warn_throttled(
+                f"no-keyvault:{secret_name}",
+                "Key Vault not configured, cannot resolve '%s'",
+                secret_name,
+            )
 
-        # Support env:VAR_NAME pattern (legacy, but secure when documented)
-        elif value.startswith("env:"):
-            env_var = value.split(":", 1)[1]
-            result = os.environ.get(env_var, "")
-            if not result:
-                self.logger.warning(f"Environment variable '{env_var}' not set")
-            return result
+        if env_fallback or self.environment != "prod":
+            return env_fallback
 
-        # Return value as-is if no special prefix
-        return value
+        # In production, fail loudly if Key Vault was expected but unavailable
+        if client_ready:
+            message = (
+                f"Production environment requires Key Vault for secret '{secret_name}', "
+                f"but _resolve_secret_reference() is a sync method. "
+                f"Set env var {env_name} or use get_secret() async method."
+            )
+        else:
+            message = (
+                f"Production environment requires Key Vault for secret '{secret_name}'. "
+                f"Key Vault URL: {self.vault_url or 'not configured'}. "
+                "Environment fallback not allowed in production."
+            )
+        self.logger.error(
+            "Failed to resolve secret '%s' from Key Vault: %s", secret_name, message
+        )
+        raise ConfigurationError(message)
+
+    def _resolve_env_reference(self, env_var: str) -> str:
+        """Resolve an 'env:VAR_NAME' reference (legacy, but secure when documented)"""
+        result = os.environ.get(env_var, "")
+        if not result:
+            self._warn_throttled(
+                f"env:{env_var}", "Environment variable '%s' not set", env_var
+            )
+        return result
+
+    def _warn_throttled(self, key: str, msg: str, *args: Any) -> None:
+        """Log a warning unless the same key was logged within WARNING_INTERVAL"""
+        now = time.monotonic()
+        last = self._warned_at.get(key)
+        if last is not None and now - last < self.WARNING_INTERVAL:
+            return
+        self._warned_at[key] = now
+        self.logger.warning(msg, *args)
+
+    _REFERENCE_RESOLVERS: ClassVar[Dict[str, Callable[[Any, str], str]]] = {
+        "keyvault": _resolve_keyvault_reference,
+        "env": _resolve_env_reference,
+    }
 
     async def get_secret(self, secret_name: str) -> str:
         """
         Get secret from Key Vault
 
+        Fetched values are reused for SECRET_CACHE_TTL seconds so repeated
+        lookups and reloads do not each pay a Key Vault round-trip.
+
         Args:
             secret_name: Name of the secret
 
@@ -576,61 +919,136 @@ class ConfigManager:
         if not self.vault_url:
             raise ConfigurationError("Key Vault URL not configured")
 
+        cached = self._secret_cache.get(secret_name)
+        if cached is not None and time.monotonic() - cached[0] < self.SECRET_CACHE_TTL:
+            return cached[1]
+
         try:
             secret = await self.secret_client.get_secret(secret_name)
+            self._secret_cache[secret_name] = (time.monotonic(), secret.value)
             return secret.value
         except Exception as e:
-            self.logger.error(f"Failed to retrieve secret {secret_name}: {e!s}")
+            self.logger.error("Failed to retrieve secret %s: %s", secret_name, e)
             raise ConfigurationError(f"Failed to retrieve secret {secret_name}") from e
 
+    def _typed_config(
+        self, component: str, build: Callable[[Mapping[str, Any]], Any]
+    ) -> Any:
+        """Return the dataclass for a component, built once per published snapshot"""
+        snapshot = self._snapshot
+        cached = self._typed_config_cache.get(component)
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+        typed = build(snapshot.get(component, _EMPTY_CONFIG))
+        self._typed_config_cache[component] = (snapshot, typed)
+        return typed
+
+    # Attribute-style access to the typed configs. These are plain properties
+    # over the per-snapshot cache rather than functools.cached_property, which
+    # a reader could repopulate from the previous snapshot mid-reload.
+    @property
+    def database_config(self) -> DatabaseConfig:
+        """Database configuration for the current snapshot"""
+        return self._typed_config("database", self._build_database_config)
+
+    @property
+    def aws_config(self) -> AwsConfig:
+        """AWS configuration for the current snapshot"""
+        return self._typed_config("aws", self._build_aws_config)
+
+    @property
+    def sentinel_config(self) -> SentinelConfig:
+        """Sentinel configuration for the current snapshot"""
+        return self._typed_config("sentinel", self._build_sentinel_config)
+
+    @property
+    def monitoring_config(self) -> MonitoringConfig:
+        """Monitoring configuration for the current snapshot"""
+        return self._typed_config("monitoring", self._build_monitoring_config)
+
+    async def get_secrets(self, secret_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Get several secrets from Key Vault concurrently
+
+        Total latency is roughly one round-trip instead of one per secret.
+        Values are served from and stored in the same TTL cache as get_secret().
+
+        Args:
+            secret_names: Names of the secrets (duplicates are fetched once)
+
+        Returns:
+            Mapping of secret name to value
+
+        Raises:
+            ConfigurationError: If any secret cannot be retrieved
+        """
+        names = list(dict.fromkeys(secret_names))
+        values = await self._gather_secrets(names)
+        return dict(zip(names, values, strict=False))
+
     def get_database_config(self) -> DatabaseConfig:
         """Get database configuration as dataclass"""
-        db_config = self.get_config("database")
+        return self._typed_config("database", self._build_database_config)
+
+    @staticmethod
+    def _build_database_config(db_config: Mapping[str, Any]) -> DatabaseConfig:
+        # Positional in field order: skips the kwargs dict the generated __init__ unpacks
         return DatabaseConfig(
-            host=db_config["host"],
-            port=db_config["port"],
-            database=db_config["database"],
-            username=db_config["username"],
-            password=db_config["password"],
-            ssl_enabled=db_config.get("ssl_enabled", True),
-            connection_timeout=db_config.get("connection_timeout", 30),
-            max_connections=db_config.get("max_connections", 10),
+            db_config["host"],
+            db_config["port"],
+            db_config["database"],
+            db_config["username"],
+            db_config["password"],
+            db_config.get("ssl_enabled", True),
+            db_config.get("connection_timeout", 30),
+            db_config.get("max_connections", 10),
         )
 
     def get_aws_config(self) -> AwsConfig:
         """Get AWS configuration as dataclass"""
-        aws_config = self.get_config("aws")
+        return self._typed_config("aws", self._build_aws_config)
+
+    @staticmethod
+    def _build_aws_config(aws_config: Mapping[str, Any]) -> AwsConfig:
         return AwsConfig(
-            access_key_id=aws_config["access_key_id"],
-            secret_access_key=aws_config["secret_access_key"],
-            region=aws_config["region"],
-            bucket_name=aws_config["bucket_name"],
-            prefix=aws_config.get("prefix", ""),
-            batch_size=aws_config.get("batch_size", 1000),
-            max_retries=aws_config.get("max_retries", 3),
+            aws_config["access_key_id"],
+            aws_config["secret_access_key"],
+            aws_config["region"],
+            aws_config["bucket_name"],
+            aws_config.get("prefix", ""),
+            aws_config.get("batch_size", 1000),
+            aws_config.get("max_retries", 3),
         )
 
     def get_sentinel_config(self) -> SentinelConfig:
         """Get Sentinel configuration as dataclass"""
-        sentinel_config = self.get_config("sentinel")
+        return self._typed_config("sentinel", self._build_sentinel_config)
+
+    @staticmethod
+    def _build_sentinel_config(sentinel_config: Mapping[str, Any]) -> SentinelConfig:
         return SentinelConfig(
-            workspace_id=sentinel_config["workspace_id"],
-            dcr_endpoint=sentinel_config["dcr_endpoint"],
-            rule_id=sentinel_config["rule_id"],
-            stream_name=sentinel_config["stream_name"],
-            table_name=sentinel_config["table_name"],
-            batch_size=sentinel_config.get("batch_size", 1000),
-            retention_days=sentinel_config.get("retention_days", 90),
+            sentinel_config["workspace_id"],
+            sentinel_config["dcr_endpoint"],
+            sentinel_config["rule_id"],
+            sentinel_config["stream_name"],
+            sentinel_config["table_name"],
+            sentinel_config.get("batch_size", 1000),
+            sentinel_config.get("retention_days", 90),
         )
 
     def get_monitoring_config(self) -> MonitoringConfig:
         """Get monitoring configuration as dataclass"""
-        monitoring_config = self.get_config("monitoring")
+        return self._typed_config("monitoring", self._build_monitoring_config)
+
+    @staticmethod
+    def _build_monitoring_config(
+        monitoring_config: Mapping[str, Any]
+    ) -> MonitoringConfig:
         return MonitoringConfig(
-            metrics_endpoint=monitoring_config["metrics_endpoint"],
-            alert_webhook=monitoring_config["alert_webhook"],
-            log_level=monitoring_config.get("log_level", "INFO"),
-            enable_prometheus=monitoring_config.get("enable_prometheus", True),
-            metrics_interval=monitoring_config.get("metrics_interval", 60),
-            health_check_interval=monitoring_config.get("health_check_interval", 30),
+            monitoring_config["metrics_endpoint"],
+            monitoring_config["alert_webhook"],
+            monitoring_config.get("log_level", "INFO"),
+            monitoring_config.get("enable_prometheus", True),
+            monitoring_config.get("metrics_interval", 60),
+            monitoring_config.get("health_check_interval", 30),
         )
@@ -1,6 +1,7 @@
 # src/core/__init__.py
 """Core pipeline composition layer for S3 ingestion, parsing, and Sentinel routing."""
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -20,6 +21,9 @@ __all__ = [
 class CoreManager:
     """Central core functionality management class"""
 
+    # Object batches downloaded/parsed/routed at once (config: aws.max_concurrency)
+    DEFAULT_MAX_CONCURRENCY = 4
+
     def __init__(
         self, config: Dict[str, Any], security_manager: Any, monitoring_manager: Any
     ) -> None:
@@ -137,13 +141,10 @@ class CoreManager:
             # List objects - use async variant
             objects = await self.s3_handler.list_objects_async(bucket, prefix)
 
-            # Process in batches - use async variant
-            results = await self.s3_handler.process_files_batch_async(
-                bucket,
-                objects,
-                parser=parser,
-                callback=self._process_log_batch,
-                log_type=log_type,
+            # Process batches concurrently so downloads of one batch overlap
+            # parsing and routing of another
+            results = await self._process_objects_concurrently(
+                bucket, objects, parser, log_type
             )
 
             # Record metrics
@@ -157,6 +158,72 @@ class CoreManager:
             self.logger.error(f"Log processing failed: {e!s}")
             raise
 
+    async def _process_objects_concurrently(
+        self, bucket: str, objects: List[Dict[str, Any]], parser: Any, log_type: str
+    ) -> Dict[str, Any]:
+        """Split objects into handler-sized batches and process them with bounded concurrency."""
+        batch_size = self.s3_handler.batch_size
+        configured = self.config["aws"].get(
+            "max_concurrency", self.DEFAULT_MAX_CONCURRENCY
+        )
+        max_concurrency = max(1, int(configured))
+        if len(objects) <= batch_size or max_concurrency == 1:
+            return await self.s3_handler.process_files_batch_async(
+                bucket,
+                objects,
+                parser=parser,
+                callback=self._process_log_batch,
+                log_type=log_type,
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def process_batch(batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.s3_handler.process_files_batch_async(
+                    bucket,
+                    batch,
+                    parser=parser,
+                    callback=self._process_log_batch,
+                    log_type=log_type,
+                )
+
+        tasks = [
+            asyncio.ensure_future(process_batch(objects[i : i + batch_size]))
+            for i in range(0, len(objects), batch_size)
+        ]
+        try:
+            partials = await asyncio.gather(*tasks)
+        except BaseException:
+            # Mirror the sequential behaviour: the first failure stops the run
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return self._merge_batch_results(partials)
+
+    @staticmethod
+    def _merge_batch_results(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine per-batch results into the shape process_files_batch_async returns."""
+        successful = [item for part in partials for item in part["successful"]]
+        failed = [item for part in partials for item in part["failed"]]
+        total_files = sum(part["metrics"]["total_files"] for part in partials)
+        start_time = min(part["metrics"]["start_time"] for part in partials)
+        end_time = max(part["metrics"]["end_time"] for part in partials)
+        return {
+            "successful": successful,
+            "failed": failed,
+            "metrics": {
+                "total_files": total_files,
+                "total_bytes": sum(part["metrics"]["total_bytes"] for part in partials),
+                "start_time": start_time,
+                "end_time": end_time,
+                "duration": (end_time - start_time).total_seconds(),
+                "success_rate": len(successful) / total_files if total_files else 0,
+            },
+        }
+
     async def _process_log_batch(
         self, parsed_batch: List[Dict[str, Any]], log_type: str
     ) -> None:
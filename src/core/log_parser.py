@@ -1,12 +1,138 @@
 # src/core/log_parser.py
 """Log parser implementations and schema validation helpers for pipeline ingestion."""
 
+import csv
 import ipaddress
 import json
 import logging
+import re
+import socket
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, ClassVar, Dict, Optional
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib decoder
+    orjson = None  # type: ignore
+
+# orjson turns integers outside 64 bits into floats; any such integer has at
+# least 19 digits, so payloads containing a run that long go to the stdlib.
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON with orjson when it gives the same result as ``json.loads``."""
+    if orjson is None or _LONG_DIGIT_RUN.search(data):
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN/Infinity, which the stdlib accepts; genuinely
+        # invalid JSON raises json.JSONDecodeError from the retry.
+        return json.loads(data)
+
+
+@lru_cache(maxsize=4096)
+def _strptime_cached(timestamp_str: str, fmt: str) -> datetime:
+    """Memoized ``strptime`` for the non-ISO formats; timestamps repeat heavily within a stream."""
+    parsed = datetime.strptime(timestamp_str, fmt)
+    return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed
+
+
+def _parse_iso_utc(timestamp_str: str) -> Optional[datetime]:
+    """Slice ``YYYY-MM-DDTHH:MM:SS[.ffffff]Z`` into a datetime without ``strptime``.
+
+    Returns None when the string does not have exactly that shape so the caller
+    can fall back to the generic format loop.
+    """
+    length = len(timestamp_str)
+    if (
+        length < 20
+        or timestamp_str[-1] != "Z"
+        or timestamp_str[4] != "-"
+        or timestamp_str[7] != "-"
+        or timestamp_str[10] != "T"
+        or timestamp_str[13] != ":"
+        or timestamp_str[16] != ":"
+    ):
+        return None
+
+    microsecond = 0
+    if length > 20:
+        fraction = timestamp_str[20:-1]
+        if (
+            timestamp_str[19] != "."
+            or not 1 <= len(fraction) <= 6
+            or not (fraction.isascii() and fraction.isdigit())
+        ):
+            return None
+        microsecond = int(fraction.ljust(6, "0"))
+
+    digits = (
+        timestamp_str[0:4]
+        + timestamp_str[5:7]
+        + timestamp_str[8:10]
+        + timestamp_str[11:13]
+        + timestamp_str[14:16]
+        + timestamp_str[17:19]
+    )
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+
+    try:
+        return datetime(
+            int(digits[0:4]),
+            int(digits[4:6]),
+            int(digits[6:8]),
+            int(digits[8:10]),
+            int(digits[10:12]),
+            int(digits[12:14]),
+            microsecond,
+            tzinfo=timezone.utc,
+        )
+    except ValueError:
+        return None
+
+
+def _is_canonical_ipv4(value: Any) -> bool:
+    """Check for a canonical dotted-quad IPv4 string using the C socket helpers.
+
+    ``ipaddress.ip_address`` is pure Python and dominates per-record cost, so
+    the common IPv4 case is answered by ``inet_pton``; the round trip through
+    ``inet_ntoa`` rejects any non-canonical spelling a platform might accept.
+    """
+    try:
+        return socket.inet_ntoa(socket.inet_pton(socket.AF_INET, value)) == value
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+def _is_ip_address(value: Any) -> bool:
+    """Return whether value is a valid IPv4 or IPv6 address."""
+    if _is_canonical_ipv4(value):
+        return True
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _normalize_ip(value: str) -> str:
+    """Canonicalize an IPv4/IPv6 address string."""
+    value = value.strip()
+    if _is_canonical_ipv4(value):
+        return value
+    return str(ipaddress.ip_address(value))
+
+
+def _split_quoted(log_line: str) -> List[str]:
+    """Split a pipe-delimited line whose fields may be double-quoted."""
+    return next(csv.reader((log_line,), delimiter="|", quotechar='"'))
 
 
 class LogParserException(Exception):
@@ -28,6 +154,15 @@ class LogParser(ABC):
         """Validate parsed log data"""
         pass
 
+    def parse_many(self, log_lines: Iterable[bytes]) -> List[Dict[str, Any]]:
+        """Parse a batch of log records.
+
+        Subclasses override this to hoist per-batch work out of the per-record
+        loop; the default simply parses each record in turn.
+        """
+        parse = self.parse
+        return [parse(line) for line in log_lines]
+
 
 class FirewallLogParser(LogParser):
     """Parser for firewall logs"""
@@ -41,9 +176,19 @@ class FirewallLogParser(LogParser):
     VALID_ACTIONS: ClassVar[set[str]] = {"allow", "deny", "drop", "reset"}
     IP_FIELDS: ClassVar[set[str]] = {"src_ip", "dst_ip"}
     INT_FIELDS: ClassVar[set[str]] = {"src_port", "dst_port", "bytes"}
+    # Flow records often repeat apart from their timestamp, so the parsed
+    # fields after the timestamp are cached for recently seen lines
+    DEFAULT_TEMPLATE_CACHE_SIZE: ClassVar[int] = 4096
+    TEMPLATE_CACHE_MAX_LINE_BYTES: ClassVar[int] = 2048
+
+    def __init__(self, template_cache_size: Optional[int] = None) -> None:
+        """Initialize firewall parser mappings and supported timestamp formats.
 
-    def __init__(self) -> None:
-        """Initialize firewall parser mappings and supported timestamp formats."""
+        Args:
+            template_cache_size: Number of recently parsed line remainders
+                (everything after the timestamp) to keep for short-circuiting
+                repeated records (default: 4096, 0 disables)
+        """
         self.logger = logging.getLogger(__name__)
         self.field_mappings = {
             "src_ip": "SourceIP",
@@ -55,7 +200,12 @@ class FirewallLogParser(LogParser):
             "dst_port": "DestinationPort",
             "bytes": "BytesTransferred",
         }
-        self._field_sequence = tuple(self.field_mappings.items())
+        # (normalized_name, normalizer) pairs resolved once so parse() does not
+        # re-dispatch on the field name for every value
+        self._field_pipeline = tuple(
+            (normalized_name, self._normalizer_for(field_name))
+            for field_name, normalized_name in self.field_mappings.items()
+        )
 
         self.timestamp_formats = [
             "%Y-%m-%dT%H:%M:%S.%fZ",
@@ -64,21 +214,65 @@ class FirewallLogParser(LogParser):
             "%b %d %Y %H:%M:%S",
             "%Y/%m/%d %H:%M:%S",
         ]
-
-    def parse(self, log_data: bytes) -> Dict[str, Any]:
+        # Index of the last format that matched; streams rarely switch formats
+        self._last_fmt_idx = 0
+
+        self.template_cache_size = (
+            self.DEFAULT_TEMPLATE_CACHE_SIZE
+            if template_cache_size is None
+            else template_cache_size
+        )
+        self._template_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._template_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def parse(
+        self, log_data: bytes, processing_time: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Parse firewall log data
 
         Args:
             log_data: Raw log data in bytes
+            processing_time: ProcessingTime to stamp on the record; defaults
+                to the current UTC time
 
         Returns:
             Dict containing parsed log fields
         """
+        if processing_time is None:
+            processing_time = datetime.now(timezone.utc)
+
+        use_cache = (
+            self.template_cache_size > 0
+            and len(log_data) <= self.TEMPLATE_CACHE_MAX_LINE_BYTES
+        )
+        if use_cache:
+            # Only the timestamp changes between repeats of the same record
+            timestamp_raw, separator, remainder = log_data.partition(b"|")
+            use_cache = bool(separator) and b'"' not in timestamp_raw
+        if use_cache:
+            template = self._get_template(remainder)
+            if template is not None:
+                try:
+                    timestamp = self._parse_timestamp(
+                        timestamp_raw.decode("utf-8").lstrip()
+                    )
+                except Exception as e:
+                    raise LogParserException(
+                        f"Failed to parse firewall log: {e!s}"
+                    ) from e
+                parsed_data = {"TimeGenerated": timestamp, **template}
+                parsed_data["ProcessingTime"] = processing_time
+                return parsed_data
+
         try:
             # Decode and split log line
             log_line = log_data.decode("utf-8").strip()
-            fields = log_line.split("|")
+            # Quoted fields (e.g. rule names) may contain the delimiter; the C
+            # csv tokenizer handles them, plain split covers everything else
+            fields = _split_quoted(log_line) if '"' in log_line else log_line.split("|")
 
             # Create initial parsed data
             parsed_data = {}
@@ -88,20 +282,66 @@ class FirewallLogParser(LogParser):
             parsed_data["TimeGenerated"] = self._parse_timestamp(timestamp_str)
 
             # Parse remaining fields
-            for (field_name, normalized_name), value in zip(
-                self._field_sequence, fields[1:], strict=False
+            for (normalized_name, normalize), value in zip(
+                self._field_pipeline, fields[1:], strict=False
             ):
-                parsed_data[normalized_name] = self._normalize_field(field_name, value)
+                parsed_data[normalized_name] = normalize(value) if value else None
 
             # Add additional computed fields
             parsed_data["LogSource"] = "Firewall"
-            parsed_data["ProcessingTime"] = datetime.now(timezone.utc)
-
-            return parsed_data
+            parsed_data["ProcessingTime"] = processing_time
 
         except Exception as e:
             raise LogParserException(f"Failed to parse firewall log: {e!s}") from e
 
+        if use_cache:
+            self._store_template(remainder, parsed_data)
+        return parsed_data
+
+    def _get_template(self, remainder: bytes) -> Optional[Dict[str, Any]]:
+        """Return the cached fields for an identical line remainder, if any"""
+        with self._template_lock:
+            cached = self._template_cache.get(remainder)
+            if cached is None:
+                self.cache_misses += 1
+                return None
+            self._template_cache.move_to_end(remainder)
+            self.cache_hits += 1
+        return cached
+
+    def _store_template(self, remainder: bytes, parsed_data: Dict[str, Any]) -> None:
+        """Cache the fields parsed from a line remainder, evicting the least recently used"""
+        template = {
+            key: value
+            for key, value in parsed_data.items()
+            if key not in ("TimeGenerated", "ProcessingTime")
+        }
+        with self._template_lock:
+            self._template_cache[remainder] = template
+            if len(self._template_cache) > self.template_cache_size:
+                self._template_cache.popitem(last=False)
+
+    def parse_many(
+        self, log_lines: Iterable[bytes], fresh_timestamp: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of firewall log lines
+
+        Args:
+            log_lines: Raw log lines in bytes
+            fresh_timestamp: Stamp each record with its own ProcessingTime
+                instead of one shared time for the whole batch
+
+        Returns:
+            List of parsed log dicts
+        """
+        if fresh_timestamp:
+            return super().parse_many(log_lines)
+
+        processing_time = datetime.now(timezone.utc)
+        parse = self.parse
+        return [parse(line, processing_time) for line in log_lines]
+
     def validate(self, parsed_data: Dict[str, Any]) -> bool:
         """
         Validate parsed log data
@@ -119,10 +359,10 @@ class FirewallLogParser(LogParser):
                 return False
 
         # Validate IP addresses
-        try:
-            ipaddress.ip_address(parsed_data["SourceIP"])
-            ipaddress.ip_address(parsed_data["DestinationIP"])
-        except ValueError:
+        if not (
+            _is_ip_address(parsed_data["SourceIP"])
+            and _is_ip_address(parsed_data["DestinationIP"])
+        ):
             self.logger.error("Invalid IP address format")
             return False
 
@@ -137,41 +377,49 @@ class FirewallLogParser(LogParser):
 
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
         """Parse timestamp string into datetime object"""
-        for fmt in self.timestamp_formats:
+        parsed = _parse_iso_utc(timestamp_str)
+        if parsed is not None:
+            return parsed
+
+        # Start from the format that matched last time and wrap around
+        formats = self.timestamp_formats
+        count = len(formats)
+        start = self._last_fmt_idx if self._last_fmt_idx < count else 0
+        for offset in range(count):
+            idx = (start + offset) % count
             try:
-                parsed = datetime.strptime(timestamp_str, fmt)
-                # Attach UTC if no timezone info present
-                return (
-                    parsed.replace(tzinfo=timezone.utc)
-                    if parsed.tzinfo is None
-                    else parsed
-                )
+                parsed = _strptime_cached(timestamp_str, formats[idx])
             except ValueError:
                 continue
+            self._last_fmt_idx = idx
+            return parsed
         raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
 
     def _normalize_field(self, field_name: str, value: str) -> Any:
         """Normalize field values based on field type"""
         if not value:
             return None
+        return self._normalizer_for(field_name)(value)
 
+    def _normalizer_for(self, field_name: str) -> Callable[[str], Any]:
+        """Return the normalization function for a source field name"""
         # IP address fields
         if field_name in self.IP_FIELDS:
-            return str(ipaddress.ip_address(value.strip()))
+            return _normalize_ip
 
         # Integer fields
         if field_name in self.INT_FIELDS:
-            return int(value)
+            return int
 
         # Action field
         if field_name == "action":
-            return value.lower()
+            return str.lower
 
         # Protocol field
         if field_name == "proto":
-            return value.upper()
+            return str.upper
 
-        return value.strip()
+        return str.strip
 
 
 class JsonLogParser(LogParser):
@@ -206,7 +454,7 @@ class JsonLogParser(LogParser):
         """Parse JSON log data with security limits.
 
         Args:
-            log_data: Raw JSON data in bytes
+            log_data: Raw JSON data in bytes (str is encoded as UTF-8)
 
         Returns:
             Parsed JSON dictionary
@@ -217,6 +465,9 @@ class JsonLogParser(LogParser):
         Phase 5 (Security): Enforces size and depth limits before parsing
         Phase 4 (Resilience): Structured error logging with context
         """
+        if isinstance(log_data, str):
+            log_data = log_data.encode("utf-8")
+
         try:
             # Phase 5 (Security - B1-002): Check size limit before parsing
             payload_size = len(log_data)
@@ -306,15 +557,18 @@ class JsonLogParser(LogParser):
 
         Phase 5 (Security - B1-002/SEC-03): Prevents DoS via deeply nested JSON
         """
-        # First parse without depth check
         try:
-            parsed = json.loads(log_data)
+            parsed = _json_loads(log_data)
         except RecursionError:
             raise LogParserException(
                 f"JSON nesting depth exceeds maximum: > {self.max_depth} levels"
             ) from None
 
-        # Then validate depth
+        # Depth can never exceed the number of containers plus one, so the
+        # walk is skipped whenever the raw bracket count already fits.
+        if log_data.count(b"{") + log_data.count(b"[") < self.max_depth:
+            return parsed
+
         actual_depth = self._measure_depth(parsed, max_depth=self.max_depth)
         if actual_depth > self.max_depth:
             raise LogParserException(
@@ -324,43 +578,35 @@ class JsonLogParser(LogParser):
 
         return parsed
 
-    def _measure_depth(
-        self, obj: Any, current_depth: int = 1, max_depth: Optional[int] = None
-    ) -> int:
-        """Recursively measure the nesting depth of a JSON structure.
+    def _measure_depth(self, obj: Any, max_depth: Optional[int] = None) -> int:
+        """Measure the nesting depth of a JSON structure without recursion.
+
+        The root counts as level 1 and every value inside a container adds a
+        level, so ``{"a": 1}`` has depth 2 and ``{}`` has depth 1.
 
         Args:
             obj: Object to measure
-            current_depth: Current depth level
+            max_depth: Stop as soon as this depth is exceeded
 
         Returns:
             Maximum depth found
         """
-        if max_depth is not None and current_depth > max_depth:
-            return current_depth
-
         if not isinstance(obj, (dict, list)):
-            return current_depth
-
-        if isinstance(obj, dict):
-            if not obj:  # Empty dict
-                return current_depth
-            max_found = current_depth
-            for value in obj.values():
-                depth = self._measure_depth(value, current_depth + 1, max_depth)
-                if depth > max_found:
-                    max_found = depth
-                if max_depth is not None and max_found > max_depth:
-                    return max_found
-            return max_found
-        else:  # list
-            if not obj:  # Empty list
-                return current_depth
-            max_found = current_depth
-            for item in obj:
-                depth = self._measure_depth(item, current_depth + 1, max_depth)
-                if depth > max_found:
-                    max_found = depth
-                if max_depth is not None and max_found > max_depth:
-                    return max_found
-            return max_found
+            return 1
+
+        deepest = 1
+        stack = [(obj, 1)]
+        while stack:
+            node, depth = stack.pop()
+            if not node:  # Empty container adds no level below itself
+                continue
+            child_depth = depth + 1
+            if child_depth > deepest:
+                deepest = child_depth
+                if max_depth is not None and deepest > max_depth:
+                    return deepest
+            values = node.values() if isinstance(node, dict) else node
+            for value in values:
+                if isinstance(value, (dict, list)):
+                    stack.append((value, child_depth))
+        return deepest
@@ -6,6 +6,11 @@ from typing import Any, Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML without libyaml bindings
+    from yaml import SafeLoader as _YamlLoader
+
 from .access_control import AccessControl
 from .audit import AuditLogger
 from .config_validator import ConfigurationValidator
@@ -76,8 +81,8 @@ class SecurityManager:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load security configuration"""
         try:
-            with open(config_path) as f:
-                return yaml.safe_load(f)
+            with open(config_path, "rb") as f:
+                return yaml.load(f, Loader=_YamlLoader)
         except Exception as e:
             raise RuntimeError(f"Failed to load security config: {e!s}") from e
 
@@ -11,6 +11,11 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML without libyaml bindings
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class SecurityPolicy:
@@ -336,8 +341,8 @@ class ConfigurationValidator:
             path = Path(file_path)
 
             if path.suffix == ".yaml" or path.suffix == ".yml":
-                with open(path) as f:
-                    config = yaml.safe_load(f)
+                with open(path, "rb") as f:
+                    config = yaml.load(f, Loader=_YamlLoader)
             elif path.suffix == ".json":
                 with open(path) as f:
                     config = json.load(f)
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 
 import pytest
 
-from src.core.log_parser import JsonLogParser, LogParserException
+from src.core.log_parser import FirewallLogParser, JsonLogParser, LogParserException
 
 
 class TestFirewallLogParser:
@@ -21,6 +21,97 @@ class TestFirewallLogParser:
         assert parsed_data["FirewallAction"] == "allow"
         assert isinstance(parsed_data["TimeGenerated"], datetime)
 
+    def test_parse_many(self, firewall_parser, sample_log_line):
+        """Test batch parsing matches per-line parsing"""
+        lines = [
+            sample_log_line.encode(),
+            b"2024/02/20 12:00:01|10.0.0.2|10.0.0.3|DENY|r2|udp|53|53|12",
+        ]
+
+        parsed = firewall_parser.parse_many(lines)
+
+        assert [p["SourceIP"] for p in parsed] == ["192.168.1.1", "10.0.0.2"]
+        assert parsed[1]["FirewallAction"] == "deny"
+        assert parsed[1]["Protocol"] == "UDP"
+
+    def test_parse_many_shares_processing_time(self, firewall_parser, sample_log_line):
+        """Batch parsing stamps one ProcessingTime unless fresh ones are requested"""
+        lines = [sample_log_line.encode()] * 3
+
+        shared = firewall_parser.parse_many(lines)
+        assert len({p["ProcessingTime"] for p in shared}) == 1
+
+        fixed = datetime(2024, 2, 20, tzinfo=timezone.utc)
+        assert (
+            firewall_parser.parse(lines[0], processing_time=fixed)["ProcessingTime"]
+            == fixed
+        )
+
+    def test_parse_quoted_field_containing_delimiter(self, firewall_parser):
+        """Quoted rule names may contain the pipe delimiter"""
+        line = (
+            b'2024-02-20T12:00:00Z|192.168.1.1|10.0.0.1|deny|"allow|deny rule"|TCP|80'
+        )
+
+        parsed_data = firewall_parser.parse(line)
+
+        assert parsed_data["RuleName"] == "allow|deny rule"
+        assert parsed_data["Protocol"] == "TCP"
+        assert parsed_data["SourcePort"] == 80
+
+    def test_duplicate_lines_hit_template_cache(self, firewall_parser, sample_log_line):
+        """Identical lines are served from the template cache as independent copies"""
+        line = sample_log_line.encode()
+        first = firewall_parser.parse(line)
+        first["SourceIP"] = "mutated"
+
+        fixed = datetime(2024, 2, 20, tzinfo=timezone.utc)
+        second = firewall_parser.parse(line, processing_time=fixed)
+
+        assert second["SourceIP"] == "192.168.1.1"
+        assert second["ProcessingTime"] == fixed
+        assert firewall_parser.cache_hits == 1
+        assert firewall_parser.cache_misses == 1
+
+    def test_template_cache_evicts_least_recently_used(self):
+        """Template cache stays bounded"""
+        parser = FirewallLogParser(template_cache_size=2)
+        lines = [
+            f"2024-02-20T12:00:0{i}Z|10.0.0.{i}|10.0.0.9|allow".encode()
+            for i in range(3)
+        ]
+        for line in lines:
+            parser.parse(line)
+
+        parser.parse(lines[2])
+        parser.parse(lines[0])
+
+        assert parser.cache_hits == 1
+        assert parser.cache_misses == 4
+
+    def test_lines_differing_only_in_timestamp_hit_template_cache(
+        self, firewall_parser
+    ):
+        """The cache keys on the fields after the timestamp"""
+        fixed = datetime(2024, 2, 20, tzinfo=timezone.utc)
+        first = firewall_parser.parse(
+            b"2024-02-20T12:00:00Z|10.0.0.1|10.0.0.2|allow", processing_time=fixed
+        )
+        second = firewall_parser.parse(
+            b"2024-02-20T12:00:05Z|10.0.0.1|10.0.0.2|allow", processing_time=fixed
+        )
+
+        assert firewall_parser.cache_hits == 1
+        assert second["TimeGenerated"] == datetime(
+            2024, 2, 20, 12, 0, 5, tzinfo=timezone.utc
+        )
+        assert {k: v for k, v in second.items() if k != "TimeGenerated"} == {
+            k: v for k, v in first.items() if k != "TimeGenerated"
+        }
+
+        with pytest.raises(LogParserException):
+            firewall_parser.parse(b"not-a-time|10.0.0.1|10.0.0.2|allow")
+
     def test_normalize_ip_address(self, firewall_parser):
         """Test IP address normalization"""
         valid_ip = "192.168.1.1"
@@ -30,6 +121,14 @@ class TestFirewallLogParser:
         with pytest.raises(ValueError):
             firewall_parser._normalize_field("src_ip", invalid_ip)
 
+    def test_normalize_ip_address_non_canonical(self, firewall_parser):
+        """IPv6 is canonicalized and non-canonical IPv4 is rejected"""
+        assert firewall_parser._normalize_field("dst_ip", " 2001:DB8::1 ") == (
+            "2001:db8::1"
+        )
+        with pytest.raises(ValueError):
+            firewall_parser._normalize_field("dst_ip", "010.0.0.1")
+
     def test_parse_timestamp(self, firewall_parser):
         """Test timestamp parsing with different formats"""
         timestamps = [
@@ -42,6 +141,24 @@ class TestFirewallLogParser:
             parsed = firewall_parser._parse_timestamp(ts)
             assert isinstance(parsed, datetime)
 
+    def test_parse_timestamp_iso_fast_path_matches_strptime(self, firewall_parser):
+        """ISO fast path should agree with strptime, including fractions"""
+        assert firewall_parser._parse_timestamp("2024-02-20T12:00:00.5Z") == datetime(
+            2024, 2, 20, 12, 0, 0, 500000, tzinfo=timezone.utc
+        )
+
+        with pytest.raises(ValueError):
+            firewall_parser._parse_timestamp("2024-02-30T12:00:00Z")
+
+    def test_parse_timestamp_remembers_last_format(self, firewall_parser):
+        """Matching format is tried first for subsequent lines"""
+        firewall_parser._parse_timestamp("2024/02/20 12:00:00")
+        assert firewall_parser._last_fmt_idx == 4
+
+        parsed = firewall_parser._parse_timestamp("Feb 20 2024 12:00:00")
+        assert parsed == datetime(2024, 2, 20, 12, 0, 0, tzinfo=timezone.utc)
+        assert firewall_parser._last_fmt_idx == 3
+
     def test_validate_parsed_data(self, firewall_parser):
         """Test validation of parsed log data"""
         valid_data = {
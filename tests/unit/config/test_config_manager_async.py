@@ -247,6 +247,56 @@ class TestConfigManagerAsyncGetSecret:
 
         assert "Key Vault URL not configured" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_get_secret_reuses_value_until_ttl_expires(
+        self, tmp_path, monkeypatch
+    ):
+        """Test get_secret() caches values for SECRET_CACHE_TTL seconds"""
+        base_config = {
+            "aws": {
+                "region": "us-east-1",
+                "bucket_name": "test-bucket",
+                "access_key_id": "test-key",
+                "secret_access_key": "test-secret",
+            },
+            "sentinel": {
+                "workspace_id": "test-workspace",
+                "dcr_endpoint": "https://test.endpoint",
+                "rule_id": "test-rule",
+            },
+        }
+
+        with open(tmp_path / "base.yaml", "w") as f:
+            yaml.dump(base_config, f)
+
+        with open(tmp_path / "dev.yaml", "w") as f:
+            yaml.dump({}, f)
+
+        with (
+            patch("src.config.config_manager.SecretClient") as mock_client_class,
+            patch("src.config.config_manager.DefaultAzureCredential"),
+        ):
+            mock_client = AsyncMock()
+            mock_secret = Mock()
+            mock_secret.value = "test-secret-value"
+            mock_client.get_secret = AsyncMock(return_value=mock_secret)
+            mock_client_class.return_value = mock_client
+
+            config_manager = await ConfigManager.create(
+                config_path=str(tmp_path),
+                environment="dev",
+                vault_url="https://test.vault.azure.net",
+                enable_hot_reload=False,
+            )
+
+            assert await config_manager.get_secret("test-secret") == "test-secret-value"
+            assert await config_manager.get_secret("test-secret") == "test-secret-value"
+            assert mock_client.get_secret.await_count == 1
+
+            monkeypatch.setattr(config_manager, "SECRET_CACHE_TTL", 0.0)
+            await config_manager.get_secret("test-secret")
+            assert mock_client.get_secret.await_count == 2
+
 
 class TestConfigManagerAsyncSyncCompatibility:
     """Test ConfigManager async/sync compatibility"""
@@ -293,7 +343,7 @@ class TestConfigManagerAsyncSyncCompatibility:
     async def test_resolve_secret_reference_with_async_client(
         self, tmp_path, monkeypatch
     ):
-        """Test _resolve_secret_reference uses env fallback in sync context (async client cannot be awaited)"""
+        """Test _resolve_secret_reference serves Key Vault values prefetched by create()"""
         base_config = {
             "aws": {
                 "region": "us-east-1",
@@ -338,15 +388,16 @@ class TestConfigManagerAsyncSyncCompatibility:
                 enable_hot_reload=False,
             )
 
-            # Phase 4 (B2-008): Sync method _resolve_secret_reference falls back to env var
-            # (cannot await async client in sync context)
+            # create() batch-fetches referenced secrets, so the sync resolver
+            # returns the vault value instead of the env var fallback
             resolved_value = config_manager._resolve_secret_reference(
                 "keyvault:aws-access-key"
             )
 
-            assert (
-                resolved_value == "env-fallback-key"
-            )  # Falls back to env var in sync context
+            assert resolved_value == "resolved-key-from-vault"
+            assert config_manager.get_aws_config().access_key_id == (
+                "resolved-key-from-vault"
+            )
 
             # For async Key Vault access, use get_secret() directly
             async_resolved_value = await config_manager.get_secret("aws-access-key")
@@ -418,6 +469,165 @@ class TestConfigManagerAsyncClientIsolation:
                 "secret-value-secret3",
             ]
 
+    @pytest.mark.asyncio
+    async def test_create_prefetches_default_secrets_concurrently(self, tmp_path):
+        """Test create() fetches all missing credential secrets in one batch"""
+        base_config = {
+            "aws": {"region": "us-east-1", "bucket_name": "test-bucket"},
+            "sentinel": {
+                "workspace_id": "test-workspace",
+                "stream_name": "test-stream",
+                "table_name": "Custom_Test_CL",
+            },
+        }
+
+        with open(tmp_path / "base.yaml", "w") as f:
+            yaml.dump(base_config, f)
+
+        with open(tmp_path / "prod.yaml", "w") as f:
+            yaml.dump({}, f)
+
+        in_flight = 0
+        peak = 0
+
+        async def mock_get_secret(name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            mock_secret = Mock()
+            mock_secret.value = f"vault-{name}"
+            return mock_secret
+
+        with (
+            patch("src.config.config_manager.SecretClient") as mock_client_class,
+            patch("src.config.config_manager.DefaultAzureCredential"),
+        ):
+            mock_client = AsyncMock()
+            mock_client.get_secret = mock_get_secret
+            mock_client_class.return_value = mock_client
+
+            config_manager = await ConfigManager.create(
+                config_path=str(tmp_path),
+                environment="prod",
+                vault_url="https://test.vault.azure.net",
+                enable_hot_reload=False,
+            )
+
+        assert peak == 4
+        aws_config = config_manager.get_aws_config()
+        assert aws_config.access_key_id == "vault-aws-access-key-id"
+        assert aws_config.secret_access_key == "vault-aws-secret-access-key"
+        assert config_manager.get_sentinel_config().rule_id == "vault-sentinel-rule-id"
+
+    @pytest.mark.asyncio
+    async def test_get_secrets_batches_unique_names(self, tmp_path, monkeypatch):
+        """Test get_secrets() fetches each name once within the concurrency limit"""
+        base_config = {
+            "aws": {
+                "region": "us-east-1",
+                "bucket_name": "test-bucket",
+                "access_key_id": "test-key",
+                "secret_access_key": "test-secret",
+            },
+            "sentinel": {
+                "workspace_id": "test-workspace",
+                "dcr_endpoint": "https://test.endpoint",
+                "rule_id": "test-rule",
+            },
+        }
+
+        with open(tmp_path / "base.yaml", "w") as f:
+            yaml.dump(base_config, f)
+
+        with open(tmp_path / "dev.yaml", "w") as f:
+            yaml.dump({}, f)
+
+        fetched = []
+        in_flight = 0
+        peak = 0
+
+        async def mock_get_secret(name):
+            nonlocal in_flight, peak
+            fetched.append(name)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            mock_secret = Mock()
+            mock_secret.value = f"value-{name}"
+            return mock_secret
+
+        with (
+            patch("src.config.config_manager.SecretClient") as mock_client_class,
+            patch("src.config.config_manager.DefaultAzureCredential"),
+        ):
+            mock_client = AsyncMock()
+            mock_client.get_secret = mock_get_secret
+            mock_client_class.return_value = mock_client
+
+            config_manager = await ConfigManager.create(
+                config_path=str(tmp_path),
+                environment="dev",
+                vault_url="https://test.vault.azure.net",
+                enable_hot_reload=False,
+            )
+            monkeypatch.setattr(config_manager, "MAX_CONCURRENT_SECRET_FETCHES", 2)
+
+            secrets = await config_manager.get_secrets(["a", "b", "a", "c"])
+
+        assert secrets == {"a": "value-a", "b": "value-b", "c": "value-c"}
+        assert sorted(fetched) == ["a", "b", "c"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_create_prefetches_env_override_references(
+        self, tmp_path, monkeypatch
+    ):
+        """Test create() prefetches keyvault: references set through APP_ vars"""
+        base_config = {
+            "aws": {
+                "region": "us-east-1",
+                "bucket_name": "test-bucket",
+                "access_key_id": "test-key",
+                "secret_access_key": "test-secret",
+            },
+            "sentinel": {
+                "workspace_id": "test-workspace",
+                "dcr_endpoint": "https://test.endpoint",
+                "rule_id": "test-rule",
+            },
+        }
+
+        with open(tmp_path / "base.yaml", "w") as f:
+            yaml.dump(base_config, f)
+
+        with open(tmp_path / "dev.yaml", "w") as f:
+            yaml.dump({}, f)
+
+        monkeypatch.setenv("APP_SENTINEL_RULE_ID", "keyvault:custom-rule-id")
+
+        with (
+            patch("src.config.config_manager.SecretClient") as mock_client_class,
+            patch("src.config.config_manager.DefaultAzureCredential"),
+        ):
+            mock_client = AsyncMock()
+            mock_secret = Mock()
+            mock_secret.value = "vault-rule-id"
+            mock_client.get_secret = AsyncMock(return_value=mock_secret)
+            mock_client_class.return_value = mock_client
+
+            config_manager = await ConfigManager.create(
+                config_path=str(tmp_path),
+                environment="dev",
+                vault_url="https://test.vault.azure.net",
+                enable_hot_reload=False,
+            )
+
+        mock_client.get_secret.assert_awaited_once_with("custom-rule-id")
+        assert config_manager.get_sentinel_config().rule_id == "vault-rule-id"
+
 
 class TestConfigManagerEdgeCases:
     """Test ConfigManager edge cases with async client"""
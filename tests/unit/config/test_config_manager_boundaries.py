@@ -1,7 +1,7 @@
 import pytest
 import yaml
 
-from src.config.config_manager import ConfigManager
+from src.config.config_manager import ConfigManager, ConfigurationError
 
 
 @pytest.fixture
@@ -58,3 +58,50 @@ def test_env_override_supports_explicit_nested_path_with_double_underscore(
 
     monitoring_config = manager.get_config("monitoring")
     assert monitoring_config["metrics"]["enabled"] == "false"
+
+
+def test_environment_file_merges_into_nested_sections(config_dir):
+    with open(config_dir / "dev.yaml", "w") as file:
+        yaml.dump({"monitoring": {"metrics": {"interval": 15}}}, file)
+
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    monitoring_config = manager.get_config("monitoring")
+    assert monitoring_config["log_level"] == "INFO"
+    assert monitoring_config["metrics"] == {"enabled": True, "interval": 15}
+
+
+def test_repeated_secret_warnings_are_throttled(config_dir, monkeypatch, caplog):
+    monkeypatch.delenv("MISSING_SECRET_VAR", raising=False)
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    with caplog.at_level("WARNING", logger="ConfigManager"):
+        for _ in range(3):
+            assert manager._resolve_secret_reference("env:MISSING_SECRET_VAR") == ""
+
+    warnings = [r for r in caplog.records if "MISSING_SECRET_VAR" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_prod_keyvault_reference_without_fallback_raises(config_dir, monkeypatch):
+    monkeypatch.delenv("AWS_ROTATED_KEY", raising=False)
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+    manager.environment = "prod"
+
+    with pytest.raises(ConfigurationError, match="Environment fallback not allowed"):
+        manager._resolve_secret_reference("keyvault:aws-rotated-key")
+
+    monkeypatch.setenv("AWS_ROTATED_KEY", "from-env")
+    assert manager._resolve_secret_reference("keyvault:aws-rotated-key") == "from-env"
@@ -1,9 +1,10 @@
+from dataclasses import FrozenInstanceError
 from unittest.mock import Mock
 
 import pytest
 import yaml
 
-from src.config.config_manager import ConfigManager
+from src.config.config_manager import ConfigManager, ConfigurationError
 
 
 @pytest.fixture
@@ -59,3 +60,200 @@ def test_get_config_avoids_reload_when_component_cached(config_dir, monkeypatch)
 
     assert aws_config["region"] == "us-east-1"
     reload_spy.assert_not_called()
+
+
+def test_reload_reuses_parse_for_unchanged_yaml(config_dir, monkeypatch):
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    load_spy = Mock(wraps=yaml.load)
+    monkeypatch.setattr("src.config.config_manager.yaml.load", load_spy)
+
+    manager.reload_config()
+    load_spy.assert_not_called()
+
+    with open(config_dir / "dev.yaml", "w") as file:
+        yaml.dump({"aws": {"region": "eu-west-1"}}, file)
+
+    manager.reload_config()
+
+    assert load_spy.call_count == 1
+    assert manager.get_config("aws")["region"] == "eu-west-1"
+
+
+def test_get_config_returns_read_only_snapshot(config_dir):
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    aws_config = manager.get_config("aws")
+    with pytest.raises(TypeError):
+        aws_config["region"] = "eu-west-1"
+
+    assert manager.get_config("database") == {}
+
+
+def test_get_config_nested_values_are_read_only_copies(config_dir):
+    (config_dir / "dev.yaml").write_text(
+        yaml.dump({"monitoring": {"metrics": {"enabled": True}, "tags": ["a"]}})
+    )
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    monitoring = manager.get_config("monitoring")
+    with pytest.raises(TypeError):
+        monitoring["metrics"]["enabled"] = False
+    with pytest.raises(AttributeError):
+        monitoring["tags"].append("b")
+
+    manager._config_cache["monitoring"]["metrics"]["enabled"] = False
+    assert manager.get_config("monitoring")["metrics"]["enabled"] is True
+    assert manager.get_config("monitoring")["tags"] == ("a",)
+
+
+def test_typed_config_is_immutable(config_dir):
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    aws_config = manager.get_aws_config()
+    assert aws_config.region == "us-east-1"
+    with pytest.raises(FrozenInstanceError):
+        aws_config.region = "eu-west-1"
+
+
+def test_typed_config_is_reused_until_reload(config_dir):
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    aws_config = manager.get_aws_config()
+    assert manager.get_aws_config() is aws_config
+
+    with open(config_dir / "dev.yaml", "w") as file:
+        yaml.dump({"aws": {"region": "eu-west-1"}}, file)
+    manager.reload_config()
+
+    assert manager.get_aws_config().region == "eu-west-1"
+
+
+def test_typed_config_properties_follow_reload(config_dir):
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    assert manager.aws_config is manager.get_aws_config()
+
+    with open(config_dir / "dev.yaml", "w") as file:
+        yaml.dump({"sentinel": {"workspace_id": "env-workspace"}}, file)
+    manager.reload_config()
+
+    assert manager.sentinel_config.workspace_id == "env-workspace"
+
+
+def test_unchanged_reload_skips_validation_until_ttl(config_dir, monkeypatch):
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    validate_spy = Mock(wraps=manager._validate_config)
+    monkeypatch.setattr(manager, "_validate_config", validate_spy)
+
+    manager.reload_config(reuse_validated=True)
+    validate_spy.assert_not_called()
+    assert manager.get_aws_config().access_key_id == "test-access-key"
+
+    monkeypatch.setattr(manager, "VALIDATION_TTL", 0.0)
+    manager.reload_config(reuse_validated=True)
+    validate_spy.assert_called_once()
+
+
+def test_explicit_reload_picks_up_rotated_env_secret(config_dir, monkeypatch):
+    with open(config_dir / "dev.yaml", "w") as file:
+        yaml.dump({"aws": {"access_key_id": "env:TEST_ROTATED_KEY"}}, file)
+    monkeypatch.setenv("TEST_ROTATED_KEY", "old-key")
+
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+    assert manager.get_aws_config().access_key_id == "old-key"
+
+    monkeypatch.setenv("TEST_ROTATED_KEY", "new-key")
+    manager.reload_config()
+
+    assert manager.get_aws_config().access_key_id == "new-key"
+
+
+def test_failed_reload_keeps_last_good_config(config_dir):
+    manager = ConfigManager(
+        config_path=str(config_dir),
+        environment="dev",
+        enable_hot_reload=False,
+    )
+
+    with open(config_dir / "dev.yaml", "w") as file:
+        yaml.dump({"aws": {"region": ""}}, file)
+
+    with pytest.raises(ConfigurationError):
+        manager.reload_config()
+
+    assert manager.get_config("aws")["region"] == "us-east-1"
+    assert manager._config_cache["aws"]["region"] == "us-east-1"
+
+
+def test_json_and_flow_style_config_files_load(config_dir):
+    (config_dir / "dev.yaml").write_text('{"aws": {"region": "eu-west-1"}}')
+    (config_dir / "staging.yaml").write_text("{aws: {region: ap-south-1}}")
+
+    dev = ConfigManager(
+        config_path=str(config_dir), environment="dev", enable_hot_reload=False
+    )
+    staging = ConfigManager(
+        config_path=str(config_dir), environment="staging", enable_hot_reload=False
+    )
+
+    assert dev.get_config("aws")["region"] == "eu-west-1"
+    assert staging.get_config("aws")["region"] == "ap-south-1"
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"aws": {"region": "eu-west-1", "scale": 1e5}}',
+        '{"aws": {"region": "eu-west-1", "scale": 1.5e5}}',
+        '{"aws": {"region": "eu-west-1", "scale": 1.5e+5, "ratio": -0.25}}',
+        '{"aws": {"region": "eu-west-1", "scale": NaN, "limit": Infinity}}',
+        '{"aws": {"region": "eu-west-1", "retries": 3, "tags": ["a", null, true]}}',
+    ],
+)
+def test_json_fast_path_matches_yaml_loader(config_dir, document):
+    (config_dir / "dev.yaml").write_text(document)
+
+    manager = ConfigManager(
+        config_path=str(config_dir), environment="dev", enable_hot_reload=False
+    )
+
+    expected = yaml.safe_load(document)["aws"]
+    aws = manager.get_config("aws")
+    for key, value in expected.items():
+        actual = aws[key]
+        assert (list(actual) if isinstance(actual, tuple) else actual) == value
+        assert type(actual) is (tuple if isinstance(value, list) else type(value))
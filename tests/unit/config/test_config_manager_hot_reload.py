@@ -0,0 +1,99 @@
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+import yaml
+
+from src.config.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    base_config = {
+        "aws": {
+            "region": "us-east-1",
+            "bucket_name": "test-bucket",
+        },
+        "sentinel": {
+            "workspace_id": "base-workspace",
+        },
+    }
+
+    with open(tmp_path / "base.yaml", "w") as file:
+        yaml.dump(base_config, file)
+
+    with open(tmp_path / "dev.yaml", "w") as file:
+        yaml.dump({}, file)
+
+    return tmp_path
+
+
+@pytest.fixture
+def fast_poller(monkeypatch):
+    monkeypatch.setattr(ConfigManager, "CONFIG_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(ConfigManager, "RELOAD_DEBOUNCE", 0.01)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_watcher_reloads_when_environment_file_changes(config_dir, fast_poller):
+    manager = ConfigManager(config_path=str(config_dir), environment="dev")
+    try:
+        with open(config_dir / "dev.yaml", "w") as file:
+            yaml.dump({"aws": {"region": "eu-west-1"}}, file)
+
+        assert _wait_for(lambda: manager.get_config("aws")["region"] == "eu-west-1")
+    finally:
+        manager.stop_config_watcher()
+
+
+def test_watcher_ignores_unrelated_files(config_dir, fast_poller, monkeypatch):
+    manager = ConfigManager(config_path=str(config_dir), environment="dev")
+    reload_spy = Mock(wraps=manager.reload_config)
+    monkeypatch.setattr(manager, "reload_config", reload_spy)
+    try:
+        (config_dir / "prod.yaml").write_text("aws: {}\n")
+        time.sleep(0.1)
+    finally:
+        manager.stop_config_watcher()
+
+    reload_spy.assert_not_called()
+    assert not manager._watcher_thread.is_alive()
+
+
+def test_watcher_skips_reload_when_content_is_unchanged(
+    config_dir, fast_poller, monkeypatch
+):
+    manager = ConfigManager(config_path=str(config_dir), environment="dev")
+    reload_spy = Mock(wraps=manager.reload_config)
+    monkeypatch.setattr(manager, "reload_config", reload_spy)
+    try:
+        stat = (config_dir / "dev.yaml").stat()
+        os.utime(
+            config_dir / "dev.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9)
+        )
+        time.sleep(0.1)
+    finally:
+        manager.stop_config_watcher()
+
+    reload_spy.assert_not_called()
+
+
+def test_watcher_not_started_without_config_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_AWS_REGION", "us-east-1")
+    monkeypatch.setenv("APP_AWS_BUCKET_NAME", "env-bucket")
+    monkeypatch.setenv("APP_SENTINEL_WORKSPACE_ID", "env-workspace")
+
+    manager = ConfigManager(config_path=str(tmp_path), environment="dev")
+
+    assert manager.get_config("aws")["bucket_name"] == "env-bucket"
+    assert not hasattr(manager, "_watcher_thread")
+    manager.stop_config_watcher()
@@ -0,0 +1,91 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core import CoreManager
+
+
+def _make_manager(max_concurrency: int) -> CoreManager:
+    config = {
+        "aws": {"region": "us-east-1", "max_concurrency": max_concurrency},
+        "sentinel": {
+            "dcr_endpoint": "https://test.endpoint",
+            "rule_id": "test-rule",
+            "stream_name": "test-stream",
+        },
+    }
+    monitoring_manager = Mock()
+    monitoring_manager.record_metric = AsyncMock()
+
+    manager = CoreManager(config, Mock(), monitoring_manager)
+    manager.s3_handler = Mock(batch_size=2)
+    manager.parsers = {"json": Mock()}
+    manager._initialized = True
+    return manager
+
+
+def _objects(count: int):
+    return [{"Key": f"logs/{i}.json", "Size": 10} for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_process_logs_runs_batches_with_bounded_concurrency():
+    manager = _make_manager(max_concurrency=2)
+    manager.s3_handler.list_objects_async = AsyncMock(return_value=_objects(5))
+
+    active = 0
+    peak_active = 0
+    batches = []
+
+    async def fake_process(bucket, objects, **kwargs):
+        nonlocal active, peak_active
+        active += 1
+        peak_active = max(peak_active, active)
+        batches.append([obj["Key"] for obj in objects])
+        await asyncio.sleep(0.01)
+        active -= 1
+        now = datetime.now(timezone.utc)
+        return {
+            "successful": [{"key": obj["Key"]} for obj in objects],
+            "failed": [],
+            "metrics": {
+                "total_files": len(objects),
+                "total_bytes": 10 * len(objects),
+                "start_time": now,
+                "end_time": now,
+            },
+        }
+
+    manager.s3_handler.process_files_batch_async = fake_process
+
+    results = await manager.process_logs("bucket", "logs/", "json")
+
+    assert peak_active == 2
+    assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+    assert len(results["successful"]) == 5
+    assert results["metrics"]["total_files"] == 5
+    assert results["metrics"]["total_bytes"] == 50
+    assert results["metrics"]["success_rate"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_logs_cancels_remaining_batches_on_failure():
+    manager = _make_manager(max_concurrency=2)
+    manager.s3_handler.list_objects_async = AsyncMock(return_value=_objects(6))
+
+    finished = []
+
+    async def fake_process(bucket, objects, **kwargs):
+        if objects[0]["Key"] == "logs/0.json":
+            raise RuntimeError("routing failed")
+        await asyncio.sleep(1)
+        finished.append(objects[0]["Key"])
+
+    manager.s3_handler.process_files_batch_async = fake_process
+
+    with pytest.raises(RuntimeError, match="routing failed"):
+        await manager.process_logs("bucket", "logs/", "json")
+
+    assert finished == []
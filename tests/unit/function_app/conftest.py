@@ -0,0 +1,70 @@
+"""Shared fixtures for the S3 Sentinel Function App connector tests."""
+
+import importlib.util
+import io
+from pathlib import Path
+
+import pytest
+from azure.core.exceptions import HttpResponseError
+
+FUNCTION_APP_INIT = (
+    Path(__file__).resolve().parents[3]
+    / "Solutions"
+    / "S3SentinelConnector"
+    / "Data Connectors"
+    / "S3SentinelConnector_FunctionApp"
+    / "__init__.py"
+)
+
+
+@pytest.fixture(scope="session")
+def function_app():
+    """The Function App module, loaded from its (non-importable) directory."""
+    spec = importlib.util.spec_from_file_location(
+        "s3_sentinel_function_app", FUNCTION_APP_INIT
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class StubS3Client:
+    """Serves object bodies from a dict of key -> bytes."""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+
+class StubLogsClient:
+    """Records uploaded batches; fails uploads containing a marked record."""
+
+    def __init__(self, fail_marker=None):
+        self.fail_marker = fail_marker
+        self.uploads = []
+
+    def upload(self, rule_id, stream_name, logs):
+        if self.fail_marker is not None and any(
+            record.get("SourceIP") == self.fail_marker for record in logs
+        ):
+            raise HttpResponseError(message="ingestion rejected")
+        self.uploads.append(list(logs))
+
+
+@pytest.fixture
+def connector(function_app, monkeypatch):
+    """A firewall connector with stub S3 and DCR clients and in-memory state."""
+    monkeypatch.setenv("DCR_ENDPOINT", "https://dcr.example.invalid")
+    monkeypatch.setenv("DCR_RULE_ID", "dcr-rule")
+    monkeypatch.setenv("DCR_STREAM_NAME", "Custom-Firewall")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test-key")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test-secret")
+    for name in ("KEY_VAULT_URL", "AzureWebJobsStorage", "BATCH_SIZE", "LOG_TYPE"):
+        monkeypatch.delenv(name, raising=False)
+
+    instance = function_app.S3SentinelConnector()
+    instance.s3_client = StubS3Client({})
+    instance.logs_client = StubLogsClient()
+    return instance
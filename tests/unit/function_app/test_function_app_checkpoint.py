@@ -0,0 +1,110 @@
+"""Tests for the Function App listing checkpoint and its persisted state."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+BASE_TIME = datetime(2024, 2, 20, tzinfo=timezone.utc)
+
+
+def _objects(*keys):
+    return [
+        {"Key": key, "Size": 1, "LastModified": BASE_TIME + timedelta(minutes=i)}
+        for i, key in enumerate(keys)
+    ]
+
+
+def _run(connector, monkeypatch, bodies):
+    objects = _objects(*bodies)
+    for obj in objects:
+        obj["Size"] = len(bodies[obj["Key"]])
+    connector.s3_client.objects = bodies
+    monkeypatch.setattr(connector, "list_new_objects", lambda *_: objects)
+    return connector.run()
+
+
+def test_checkpoint_advances_past_fully_processed_objects(connector, monkeypatch):
+    bodies = {
+        "logs/a.log": b"10.0.0.1|10.0.0.9|allow\n",
+        "logs/b.log": b"10.0.0.2|10.0.0.9|allow\n",
+    }
+
+    result = _run(connector, monkeypatch, bodies)
+
+    assert result["status"] == "success"
+    assert connector.last_processed_key == "logs/b.log"
+    assert connector.last_modified_after == BASE_TIME + timedelta(minutes=1)
+
+
+def test_failed_upload_holds_checkpoint_before_its_object(connector, monkeypatch):
+    connector.batch_size = 1
+    connector.logs_client.fail_marker = "10.0.0.2"
+    bodies = {
+        "logs/a.log": b"10.0.0.1|10.0.0.9|allow\n",
+        "logs/b.log": b"10.0.0.2|10.0.0.9|allow\n",
+        "logs/c.log": b"10.0.0.3|10.0.0.9|allow\n",
+    }
+
+    _run(connector, monkeypatch, bodies)
+
+    assert connector.last_processed_key == "logs/a.log"
+    assert connector.last_modified_after == BASE_TIME
+
+
+def test_failed_download_leaves_checkpoint_unset(connector, monkeypatch):
+    bodies = {"logs/a.log": b"10.0.0.1|10.0.0.9|allow\n"}
+    objects = _objects("logs/missing.log", "logs/a.log")
+    connector.s3_client.objects = bodies
+    monkeypatch.setattr(connector, "list_new_objects", lambda *_: objects)
+
+    connector.run()
+
+    assert connector.last_processed_key is None
+    assert connector.last_modified_after is None
+
+
+class _StateBlob:
+    def __init__(self, content):
+        self.content = content
+
+    def download_blob(self):
+        return self
+
+    def readall(self):
+        return self.content
+
+
+class _StateContainer:
+    def __init__(self, content):
+        self.blob = _StateBlob(content)
+
+    def get_blob_client(self, name):
+        return self.blob
+
+
+def test_load_state_restores_saved_checkpoint(connector):
+    connector.state_container = _StateContainer(
+        b'{"last_modified": "2024-02-20T00:00:00+00:00", "last_key": "logs/a.log"}'
+    )
+
+    connector._load_state()
+
+    assert connector.last_processed_key == "logs/a.log"
+    assert connector.last_modified_after == BASE_TIME
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'["logs/a.log"]',
+        b'{"last_modified": "not-a-time", "last_key": "logs/a.log"}',
+        b'{"last_modified": 20240220, "last_key": "logs/a.log"}',
+    ],
+)
+def test_load_state_ignores_corrupt_state(connector, content):
+    connector.state_container = _StateContainer(content)
+
+    connector._load_state()
+
+    assert connector.last_processed_key is None
+    assert connector.last_modified_after is None
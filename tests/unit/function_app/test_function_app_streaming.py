@@ -0,0 +1,144 @@
+"""Tests for streaming and parsing S3 objects in the Function App connector."""
+
+import gzip
+import json
+
+import pytest
+
+RECORDS = [
+    {
+        "src_ip": "10.0.0.1",
+        "dst_ip": "10.0.0.9",
+        "action": "allow",
+        "timestamp": "2024-02-20T12:00:00Z",
+    },
+    {
+        "src_ip": "10.0.0.2",
+        "dst_ip": "10.0.0.9",
+        "action": "deny",
+        "timestamp": "2024-02-20T12:00:01Z",
+    },
+]
+NDJSON = "\n".join(json.dumps(record) for record in RECORDS).encode() + b"\n"
+
+
+def _stream(connector, key, body):
+    connector.s3_client.objects = {key: body}
+    emitted = []
+    ok = connector._stream_object({"Key": key, "Size": len(body)}, emitted.append)
+    return ok, [record for batch in emitted for record in batch]
+
+
+def test_unterminated_quote_does_not_swallow_following_lines(connector):
+    body = b'10.0.0.1|10.0.0.9|allow|TCP|1|2|3|"unterminated\n' + (
+        b"10.0.0.2|10.0.0.9|deny|UDP|1|2|3|rule\n" * 20000
+    )
+
+    ok, records = _stream(connector, "logs/fw.log", body)
+
+    assert ok
+    assert len(records) == 20001
+    assert records[0]["RuleName"] == '"unterminated'
+    assert records[1]["SourceIP"] == "10.0.0.2"
+
+
+def test_quoted_field_may_contain_delimiter(connector):
+    ok, records = _stream(
+        connector, "logs/fw.csv", b'10.0.0.1,10.0.0.9,allow,TCP,1,2,3,"web, ssh"\n'
+    )
+
+    assert ok
+    assert records[0]["RuleName"] == "web, ssh"
+
+
+@pytest.mark.parametrize(
+    ("key", "body"),
+    [
+        ("logs/events.json", NDJSON),
+        ("logs/events.json.gz", gzip.compress(NDJSON)),
+        ("logs/events.dat", gzip.compress(NDJSON)),
+        ("logs/events.json", json.dumps(RECORDS).encode()),
+        ("logs/events.json", json.dumps(RECORDS, indent=2).encode()),
+        ("logs/events.json", "".join(json.dumps(r) for r in RECORDS).encode()),
+        ("logs/events.log", NDJSON),
+        ("logs/events.log", json.dumps(RECORDS, indent=2).encode()),
+    ],
+    ids=[
+        "ndjson",
+        "gzipped-ndjson",
+        "gzip-detected-by-magic",
+        "array",
+        "pretty-printed-array",
+        "concatenated-objects",
+        "log-holding-ndjson",
+        "log-holding-pretty-array",
+    ],
+)
+def test_json_bodies(connector, key, body):
+    ok, records = _stream(connector, key, body)
+
+    assert ok
+    assert [r["SourceIP"] for r in records] == ["10.0.0.1", "10.0.0.2"]
+    assert records[1]["Action"] == "deny"
+    assert records[1]["TimeGenerated"] == "2024-02-20T12:00:01+00:00"
+
+
+def test_concatenated_json_skips_scalars_and_broken_lines(connector):
+    body = (
+        json.dumps(RECORDS[0]).encode()
+        + json.dumps(RECORDS[1]).encode()
+        + b"\n123abc\n42\n"
+        + json.dumps(RECORDS[0]).encode()
+        + b" trailing text\n"
+    )
+
+    ok, records = _stream(connector, "logs/events.json", body)
+
+    assert ok
+    assert [r["SourceIP"] for r in records] == ["10.0.0.1", "10.0.0.2"]
+
+
+def test_csv_body(connector):
+    body = b"10.0.0.1,10.0.0.9,allow,TCP\n\n10.0.0.2,10.0.0.9,deny,UDP\n"
+
+    ok, records = _stream(connector, "logs/events.csv", body)
+
+    assert ok
+    assert [(r["SourceIP"], r["Protocol"]) for r in records] == [
+        ("10.0.0.1", "TCP"),
+        ("10.0.0.2", "UDP"),
+    ]
+
+
+def test_bracketed_text_log_is_not_sniffed_as_json(connector):
+    body = b"[2024-02-20 12:00:00]|10.0.0.1|10.0.0.9|allow\n"
+
+    ok, records = _stream(connector, "logs/events.log", body)
+
+    assert ok
+    assert records[0]["SourceIP"] == "[2024-02-20 12:00:00]"
+    assert records[0]["DestinationIP"] == "10.0.0.1"
+
+
+def test_batches_are_emitted_in_batch_size_lists(connector):
+    connector.batch_size = 1
+    connector.s3_client.objects = {"logs/events.json": NDJSON}
+    emitted = []
+
+    assert connector._stream_object(
+        {"Key": "logs/events.json", "Size": len(NDJSON)}, emitted.append
+    )
+    assert [len(batch) for batch in emitted] == [1, 1]
+
+
+def test_large_gzip_is_spooled_for_parallel_inflate(
+    connector, function_app, monkeypatch
+):
+    if function_app.rapidgzip is None:
+        pytest.skip("rapidgzip is not installed")
+    monkeypatch.setattr(function_app, "PARALLEL_GZIP_MIN_SIZE", 0)
+
+    ok, records = _stream(connector, "logs/events.json.gz", gzip.compress(NDJSON))
+
+    assert ok
+    assert [r["SourceIP"] for r in records] == ["10.0.0.1", "10.0.0.2"]
@@ -0,0 +1,86 @@
+"""Tests that the Function App timestamp fast path agrees with strptime."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+TIMESTAMPS = [
+    "2024-02-20T12:00:00Z",
+    "2024-02-20T12:00:00.5Z",
+    "2024-02-20T12:00:00.123456Z",
+    "2024-02-20T12:00:00.1234567Z",
+    "2024-02-20T12:00:00.Z",
+    "2024-02-30T12:00:00Z",
+    "2024-02-30T12:00:00.5Z",
+    "2024-13-01T12:00:00Z",
+    "2024-02-20T24:00:00Z",
+    "2024-02-20T12:00:60Z",
+    "2024-02-20T12:00:00+00:00",
+    "2024-02-20 12:00:00",
+    "2024-02-30 12:00:00",
+    "2024-2-20 12:00:00",
+    "2024-02-20 12:00",
+    "Feb 20 2024 12:00:00",
+    "feb 20 2024 12:00:00",
+    "Feb 2 2024 1:2:3",
+    "Feb 30 2024 12:00:00",
+    "Foo 20 2024 12:00:00",
+    "2024/02/20 12:00:00",
+    "20/02/2024 12:00:00",
+    "1708430400",
+    "not a timestamp",
+]
+
+
+def _strptime_loop(ts_str, formats):
+    """The reference behaviour: try each configured format with strptime."""
+    for fmt in formats:
+        try:
+            parsed = datetime.strptime(ts_str, fmt)
+        except ValueError:
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.isoformat()
+    return ts_str
+
+
+@pytest.mark.parametrize("log_type", ["firewall", "vpn"])
+@pytest.mark.parametrize("ts_str", TIMESTAMPS)
+def test_parse_timestamp_matches_strptime(connector, log_type, ts_str):
+    formats = tuple(connector.table_configs[log_type]["timestamp_formats"])
+
+    assert connector._parse_timestamp(ts_str, formats) == _strptime_loop(
+        ts_str, formats
+    )
+
+
+@pytest.mark.parametrize("ts_str", TIMESTAMPS)
+def test_fast_path_only_returns_what_strptime_would(connector, ts_str):
+    formats = tuple(connector.table_configs["firewall"]["timestamp_formats"])
+
+    fast = connector._parse_timestamp_fast(ts_str, formats)
+
+    if fast is not None:
+        expected = _strptime_loop(ts_str, formats)
+        assert fast.replace(tzinfo=timezone.utc).isoformat() == expected
+
+
+def test_non_iso_input_falls_through_to_strptime(connector):
+    formats = ("%Y/%m/%d %H:%M:%S",)
+
+    assert connector._parse_timestamp_fast("2024/02/20 12:00:00", formats) is None
+    assert connector._parse_timestamp("2024/02/20 12:00:00", formats) == (
+        "2024-02-20T12:00:00+00:00"
+    )
+
+
+def test_fast_path_handles_configured_shapes(connector):
+    formats = tuple(connector.table_configs["firewall"]["timestamp_formats"])
+
+    assert connector._parse_timestamp_fast(
+        "2024-02-20T12:00:00.5Z", formats
+    ) == datetime(2024, 2, 20, 12, 0, 0, 500000)
+    assert connector._parse_timestamp_fast("Feb 20 2024 12:00:00", formats) == datetime(
+        2024, 2, 20, 12, 0, 0
+    )
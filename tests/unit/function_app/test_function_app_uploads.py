@@ -0,0 +1,82 @@
+"""Tests for the Function App DCR upload pipeline."""
+
+import queue
+import threading
+import time
+
+
+def _record(n):
+    return {"SourceIP": f"10.0.0.{n}", "DestinationIP": "10.0.0.9"}
+
+
+def _drain(connector, items, maxsize=0):
+    """Feed (key, records) items through _upload_batches on its own thread."""
+    batches = queue.Queue(maxsize=maxsize)
+    failed_keys = set()
+    uploader = threading.Thread(
+        target=connector._upload_batches, args=(batches, failed_keys), daemon=True
+    )
+    uploader.start()
+    for item in items:
+        batches.put(item, timeout=5)
+    batches.put(None, timeout=5)
+    uploader.join(timeout=5)
+    assert not uploader.is_alive()
+    return failed_keys
+
+
+def test_small_batches_are_coalesced_into_full_uploads(connector):
+    connector.batch_size = 3
+    items = [
+        ("logs/a.log", [_record(1), _record(2)]),
+        ("logs/b.log", [_record(3), _record(4)]),
+        ("logs/c.log", [_record(5), _record(6)]),
+        ("logs/d.log", [_record(7)]),
+    ]
+
+    failed_keys = _drain(connector, items)
+
+    sizes = [len(upload) for upload in connector.logs_client.uploads]
+    assert sorted(sizes, reverse=True) == [3, 3, 1]
+    uploaded = sorted(r["SourceIP"] for u in connector.logs_client.uploads for r in u)
+    assert uploaded == sorted(f"10.0.0.{n}" for n in range(1, 8))
+    assert failed_keys == set()
+
+
+def test_uploads_in_flight_never_exceed_dcr_concurrency(connector):
+    connector.batch_size = 1
+    connector.dcr_concurrency = 2
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    class SlowLogsClient:
+        def upload(self, rule_id, stream_name, logs):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.05)
+            with lock:
+                state["in_flight"] -= 1
+
+    connector.logs_client = SlowLogsClient()
+
+    _drain(connector, [(f"logs/{n}.log", [_record(n)]) for n in range(10)])
+
+    assert state["peak"] == 2
+
+
+def test_ingest_exception_does_not_block_producers(connector, monkeypatch):
+    connector.batch_size = 1
+    connector.dcr_concurrency = 1
+
+    def fail(records):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(connector, "ingest_to_sentinel", fail)
+    items = [(f"logs/{n}.log", [_record(n)]) for n in range(20)]
+
+    # A dead consumer would leave put() blocked on the one-slot queue
+    failed_keys = _drain(connector, items, maxsize=1)
+
+    assert failed_keys == {f"logs/{n}.log" for n in range(20)}
+    assert connector.metrics["errors"] == 20
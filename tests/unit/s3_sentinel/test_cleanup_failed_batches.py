@@ -44,3 +44,27 @@ def test_cleanup_failed_batches_deletes_old_files(tmp_path):
     assert summary.files_examined == 1
     assert summary.files_deleted == 1
     assert not old_file.exists()
+
+
+def test_cleanup_failed_batches_only_examines_json_files(tmp_path):
+    old_timestamp = (datetime.now(timezone.utc) - timedelta(days=45)).timestamp()
+    for name in ("old.json", "notes.txt"):
+        path = tmp_path / name
+        path.write_text("{}", encoding="utf-8")
+        os.utime(path, (old_timestamp, old_timestamp))
+    (tmp_path / "nested.json").mkdir()
+    (tmp_path / "recent.json").write_text("{}", encoding="utf-8")
+
+    summary = cleanup_failed_batches(
+        directory=str(tmp_path),
+        max_age_days=30,
+        dry_run=False,
+    )
+
+    assert summary.files_examined == 2
+    assert summary.files_deleted == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "nested.json",
+        "notes.txt",
+        "recent.json",
+    ]
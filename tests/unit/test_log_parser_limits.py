@@ -182,6 +182,25 @@ class TestJsonDepthLimits:
 
         assert measured > 3
 
+    def test_measure_depth_does_not_recurse(self):
+        """Phase 6 (Performance): Depth walk handles nesting beyond the recursion limit."""
+        parser = JsonLogParser()
+
+        nested: list = []
+        for _i in range(5000):
+            nested = [nested]
+
+        assert parser._measure_depth(nested) == 5001
+
+    def test_brackets_inside_strings_do_not_count(self):
+        """Phase 7: Bracket characters in string values are not nesting."""
+        parser = JsonLogParser(max_depth=3)
+        payload = json.dumps({"rule": "[[[{{{" * 10, "inner": {"a": 1}}).encode()
+
+        result = parser.parse(payload)
+
+        assert result["inner"] == {"a": 1}
+
 
 class TestCombinedLimits:
     """Test combined size and depth scenarios."""
@@ -334,3 +353,39 @@ class TestEdgeCases:
             parser.parse(invalid)
 
         assert "Invalid JSON format" in str(exc_info.value)
+
+    def test_integers_beyond_64_bits_keep_precision(self):
+        """Phase 7: Large integers decode exactly, as with the stdlib decoder."""
+        parser = JsonLogParser()
+        big = 2**64 + 1
+
+        result = parser.parse(b'{"id": %d, "neg": -%d}' % (big, big))
+
+        assert result == {"id": big, "neg": -big}
+
+    def test_nan_and_infinity_accepted(self):
+        """Phase 7: Non-standard float constants decode as with the stdlib."""
+        parser = JsonLogParser()
+
+        result = parser.parse(b'{"a": NaN, "b": Infinity, "c": -Infinity}')
+
+        assert result["a"] != result["a"]
+        assert result["b"] == float("inf")
+        assert result["c"] == float("-inf")
+
+    def test_str_payload_accepted(self):
+        """Phase 7: Text input is measured and parsed like its UTF-8 bytes."""
+        parser = JsonLogParser(max_size_bytes=1000)
+
+        result = parser.parse(json.dumps({"text": "日本語", "n": [1]}))
+
+        assert result == {"text": "日本語", "n": [1]}
+
+    def test_str_payload_size_counted_in_bytes(self):
+        """Phase 5: The size limit applies to the encoded payload."""
+        parser = JsonLogParser(max_size_bytes=15)
+
+        with pytest.raises(LogParserException) as exc_info:
+            parser.parse(json.dumps({"t": "日本語"}, ensure_ascii=False))
+
+        assert "exceeds maximum size" in str(exc_info.value)
@@ -0,0 +1,56 @@
+"""Tests for TimeGenerated validation in the ingestion simulator script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SIMULATE_INGEST = (
+    Path(__file__).resolve().parents[3]
+    / "Solutions"
+    / "S3SentinelConnector"
+    / "Verification"
+    / "Simulate_Ingest.py"
+)
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    spec = importlib.util.spec_from_file_location("simulate_ingest", SIMULATE_INGEST)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # validate_logs needs no Azure clients, so skip the credential probe
+    return object.__new__(module.DataCollectorSimulator)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2024-02-20T12:00:00Z",
+        "2024-02-20T12:00:00.123456Z",
+        "2024-02-20T12:00:00+05:30",
+        "2024-02-29T23:59:59-08:00",
+        "2024-02-20T12:00:00",
+        "2024-02-20",
+    ],
+)
+def test_valid_timestamps_are_accepted(simulator, timestamp):
+    assert simulator.validate_logs([{"TimeGenerated": timestamp}], {}) == []
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2024-13-45T99:99:99Z",
+        "2023-02-29T12:00:00Z",
+        "2024-02-20T24:00:00Z",
+        "2024-02-20T12:00:00+24:00",
+        "2024-02-20T12:00:00Z\n",
+        "not a timestamp",
+        1708430400,
+    ],
+)
+def test_invalid_timestamps_are_rejected(simulator, timestamp):
+    assert simulator.validate_logs([{"TimeGenerated": timestamp}], {}) == [
+        "Log 0: Invalid TimeGenerated format"
+    ]